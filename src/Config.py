@@ -1,12 +1,15 @@
 from dotenv import load_dotenv
+from functools import cached_property
 import os
 
 class Config:
     """Centralized configuration loader."""
 
     def __init__(self):
-        # Load environment variables once
-        load_dotenv()
+        # Load environment variables once (also across module reloads)
+        if not os.environ.get('_DOTENV_LOADED'):
+            load_dotenv()
+            os.environ['_DOTENV_LOADED'] = '1'
 
         # AWS credentials
         self.AWS_ACCESS_KEY_ID = os.getenv("AWS_ACCESS_KEY_ID")
@@ -16,16 +19,74 @@ class Config:
         # S3 bucket for Textract async operations (required for multi-page PDFs)
         self.AWS_TEXTRACT_S3_BUCKET = os.getenv("AWS_TEXTRACT_S3_BUCKET")
 
+        # Server address and number of uvicorn worker processes (python main.py).
+        # Each worker has its own parse pool and in-memory store; set REDIS_URL
+        # so workers share parsed results
+        self.HOST = os.getenv("HOST", "0.0.0.0")
+        self.PORT = int(os.getenv("PORT", "8000"))
+        self.WEB_WORKERS = int(os.getenv("WEB_WORKERS", "1"))
+
         # CORS configuration
         self.ALLOWED_ORIGINS = os.getenv("ALLOWED_ORIGINS", "*").split(",")
 
+        # Result store: Redis when REDIS_URL is set (shared across workers), else in-memory
+        self.REDIS_URL = os.getenv("REDIS_URL")
+        self.RESULT_TTL_SECONDS = int(os.getenv("RESULT_TTL_SECONDS", "3600"))
+
+        # Number of parsed documents kept by the in-memory result store
+        self.RESULT_CACHE_SIZE = int(os.getenv("RESULT_CACHE_SIZE", "256"))
+
+        # Number of built Excel/JSON exports kept per worker for repeat downloads
+        self.EXPORT_CACHE_SIZE = int(os.getenv("EXPORT_CACHE_SIZE", "64"))
+
+        # OCR backpressure: concurrent parses, request rate (0 = unlimited) and throttling retries
+        self.MAX_OCR_CONCURRENCY = int(os.getenv("MAX_OCR_CONCURRENCY", "4"))
+        self.OCR_REQUESTS_PER_SECOND = float(os.getenv("OCR_REQUESTS_PER_SECOND", "0"))
+        self.OCR_MAX_RETRIES = int(os.getenv("OCR_MAX_RETRIES", "3"))
+
+        # Worker processes for parsing/validation (0 = run in the default thread pool)
+        self.PARSE_WORKERS = int(os.getenv("PARSE_WORKERS", str(os.cpu_count() or 1)))
+
+        # Directory for spooled uploads and other temp files (e.g. a tmpfs such as
+        # /dev/shm/blueparser-uploads); unset uses the system temp dir
+        self.UPLOAD_DIR = os.getenv("UPLOAD_DIR")
+
+        # Largest accepted upload, in megabytes
+        self.MAX_UPLOAD_MB = int(os.getenv("MAX_UPLOAD_MB", "50"))
+
+        # Maximum number of PDFs accepted by /parse-batch
+        self.MAX_BATCH_FILES = int(os.getenv("MAX_BATCH_FILES", "20"))
+
+        # Level for the 'blueparser' loggers
+        self.LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+
+        # Whether to include raw OCR data in parser output
+        self.INCLUDE_RAW_OCR = os.getenv("INCLUDE_RAW_OCR", "false").lower() == "true"
+
+    @cached_property
     def as_dict(self):
         return {
             "AWS_ACCESS_KEY_ID": self.AWS_ACCESS_KEY_ID,
             "AWS_SECRET_ACCESS_KEY": self.AWS_SECRET_ACCESS_KEY,
             "AWS_DEFAULT_REGION": self.AWS_DEFAULT_REGION,
             "AWS_TEXTRACT_S3_BUCKET": self.AWS_TEXTRACT_S3_BUCKET,
+            "HOST": self.HOST,
+            "PORT": self.PORT,
+            "WEB_WORKERS": self.WEB_WORKERS,
             "ALLOWED_ORIGINS": self.ALLOWED_ORIGINS,
+            "REDIS_URL": self.REDIS_URL,
+            "RESULT_TTL_SECONDS": self.RESULT_TTL_SECONDS,
+            "RESULT_CACHE_SIZE": self.RESULT_CACHE_SIZE,
+            "EXPORT_CACHE_SIZE": self.EXPORT_CACHE_SIZE,
+            "MAX_OCR_CONCURRENCY": self.MAX_OCR_CONCURRENCY,
+            "OCR_REQUESTS_PER_SECOND": self.OCR_REQUESTS_PER_SECOND,
+            "OCR_MAX_RETRIES": self.OCR_MAX_RETRIES,
+            "PARSE_WORKERS": self.PARSE_WORKERS,
+            "UPLOAD_DIR": self.UPLOAD_DIR,
+            "MAX_UPLOAD_MB": self.MAX_UPLOAD_MB,
+            "MAX_BATCH_FILES": self.MAX_BATCH_FILES,
+            "LOG_LEVEL": self.LOG_LEVEL,
+            "INCLUDE_RAW_OCR": self.INCLUDE_RAW_OCR,
         }
 
 # Create a singleton instance so it's only loaded once
@@ -1,4 +1,9 @@
-from typing import Dict
+from io import BytesIO, StringIO
+from typing import Dict, Iterator, Optional
+import csv
+from LogConfig import get_logger
+
+logger = get_logger('exporter')
 
 class DataExporter:
     """Export parsed data to various formats"""
@@ -6,67 +11,134 @@ class DataExporter:
     @staticmethod
     def to_json(data: Dict, output_path: str):
         """Export to JSON"""
-        import json
-        with open(output_path, 'w') as f:
-            json.dump(data, f, indent=2)
+        with open(output_path, 'wb') as f:
+            f.write(DataExporter.to_json_bytes(data))
+    
+    @staticmethod
+    def to_json_bytes(data: Dict) -> bytes:
+        """Export to indented UTF-8 JSON in memory"""
+        try:
+            import orjson
+        except ImportError:
+            import json
+            return json.dumps(data, indent=2).encode('utf-8')
+        
+        return orjson.dumps(
+            data,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        )
+    
+    CSV_HEADER = ('Category', 'Type', 'Value', 'Unit', 'Context')
     
     @staticmethod
     def to_csv(data: Dict, output_path: str):
         """Export tabular data to CSV"""
-        import csv
-        
-        # Extract flattened data
-        rows = []
-        
-        # Add specifications
-        if 'universal_data' in data and 'specification' in data['universal_data']:
-            for spec in data['universal_data']['specification']:
-                rows.append({
-                    'Category': 'Specification',
-                    'Type': spec.get('type'),
-                    'Value': spec.get('value'),
-                    'Unit': spec.get('unit'),
-                    'Context': spec.get('context', '')[:100]
-                })
+        specs = DataExporter._get_specs(data)
         
         # Write to CSV
-        if rows:
+        if specs:
             with open(output_path, 'w', newline='') as f:
-                writer = csv.DictWriter(f, fieldnames=rows[0].keys())
-                writer.writeheader()
-                writer.writerows(rows)
+                writer = csv.writer(f)
+                writer.writerow(DataExporter.CSV_HEADER)
+                writer.writerows(DataExporter._csv_rows(specs))
+    
+    @staticmethod
+    def to_csv_stream(data: Dict, rows_per_chunk: int = 500) -> Iterator[bytes]:
+        """Export tabular data as UTF-8 CSV chunks (for streaming responses)"""
+        specs = DataExporter._get_specs(data)
+        
+        buffer = StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(DataExporter.CSV_HEADER)
+        
+        for i, row in enumerate(DataExporter._csv_rows(specs), 1):
+            writer.writerow(row)
+            if i % rows_per_chunk == 0:
+                yield buffer.getvalue().encode('utf-8')
+                buffer.seek(0)
+                buffer.truncate()
+        
+        if buffer.tell():
+            yield buffer.getvalue().encode('utf-8')
+    
+    @staticmethod
+    def _get_specs(data: Dict) -> list:
+        universal_data = data.get('universal_data') or {}
+        return universal_data.get('specification') or []
+    
+    @staticmethod
+    def _csv_rows(specs: list) -> Iterator[tuple]:
+        return (
+            ('Specification', spec.get('type'), spec.get('value'),
+             spec.get('unit'), (spec.get('context') or '')[:100])
+            for spec in specs
+        )
     
     @staticmethod
     def to_excel(data: Dict, output_path: str):
         """Export to Excel with multiple sheets"""
+        wb = DataExporter._build_workbook(data)
+        if wb is not None:
+            wb.save(output_path)
+    
+    @staticmethod
+    def to_excel_bytes(data: Dict) -> Optional[bytes]:
+        """Export to an in-memory Excel workbook (None if openpyxl is missing)"""
+        wb = DataExporter._build_workbook(data)
+        if wb is None:
+            return None
+        
+        buffer = BytesIO()
+        wb.save(buffer)
+        return buffer.getvalue()
+    
+    @staticmethod
+    def _build_workbook(data: Dict):
         try:
-            import pandas as pd
+            from openpyxl import Workbook
+        except ImportError:
+            logger.warning("openpyxl required for Excel export")
+            return None
+        
+        universal_data = data.get('universal_data') or {}
+        sheets = [
+            ('Title Block', 'titleblock'),
+            ('Specifications', 'specification'),
+            ('Notes', 'notes')
+        ]
+        
+        # Write-only mode streams rows instead of keeping every cell in memory
+        wb = Workbook(write_only=True)
+        
+        for sheet_name, key in sheets:
+            if key not in universal_data:
+                continue
             
-            with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
-                # Title block sheet
-                if 'universal_data' in data and 'titleblock' in data['universal_data']:
-                    tb_df = pd.DataFrame([data['universal_data']['titleblock']])
-                    tb_df.to_excel(writer, sheet_name='Title Block', index=False)
-                
-                # Specifications sheet
-                if 'universal_data' in data and 'specification' in data['universal_data']:
-                    specs_df = pd.DataFrame(data['universal_data']['specification'])
-                    specs_df.to_excel(writer, sheet_name='Specifications', index=False)
-                
-                # Notes sheet
-                if 'universal_data' in data and 'notes' in data['universal_data']:
-                    notes_df = pd.DataFrame(data['universal_data']['notes'])
-                    notes_df.to_excel(writer, sheet_name='Notes', index=False)
+            records = universal_data[key]
+            if isinstance(records, dict):
+                records = [records]
+            records = records or []
+            
+            # Columns in first-seen order across all records
+            headers = list(dict.fromkeys(k for record in records for k in record))
+            
+            ws = wb.create_sheet(title=sheet_name)
+            if headers:
+                ws.append(headers)
+            for record in records:
+                ws.append([record.get(k) for k in headers])
         
-        except ImportError:
-            print("pandas and openpyxl required for Excel export")
+        return wb
     
     @staticmethod
     def to_database(data: Dict, db_connection):
         """Export to database (example with SQLite)"""
-        import sqlite3
-        
-        cursor = db_connection.cursor()
+        # Single transaction: commits on success, rolls back on error
+        with db_connection:
+            DataExporter._write_to_database(data, db_connection.cursor())
+    
+    @staticmethod
+    def _write_to_database(data: Dict, cursor):
         
         # Create tables if they don't exist
         cursor.execute('''
@@ -95,8 +167,9 @@ class DataExporter:
         ''')
         
         # Insert drawing
-        title_block = data.get('universal_data', {}).get('titleblock', {})
-        classification = data.get('classification', {})
+        universal_data = data.get('universal_data') or {}
+        title_block = universal_data.get('titleblock') or {}
+        classification = data.get('classification') or {}
         
         cursor.execute('''
             INSERT INTO drawings (drawing_number, title, drawing_type, discipline, scale, date)
@@ -112,18 +185,18 @@ class DataExporter:
         
         drawing_id = cursor.lastrowid
         
-        # Insert specifications
-        specs = data.get('universal_data', {}).get('specification', [])
-        for spec in specs:
-            cursor.execute('''
-                INSERT INTO specifications (drawing_id, spec_type, value, unit, context)
-                VALUES (?, ?, ?, ?, ?)
-            ''', (
+        # Insert specifications in one batched statement
+        specs = universal_data.get('specification') or []
+        cursor.executemany('''
+            INSERT INTO specifications (drawing_id, spec_type, value, unit, context)
+            VALUES (?, ?, ?, ?, ?)
+        ''', [
+            (
                 drawing_id,
                 spec.get('type'),
                 spec.get('value'),
                 spec.get('unit'),
-                spec.get('context', '')[:500]  # Truncate long context
-            ))
-        
-        db_connection.commit()
\ No newline at end of file
+                (spec.get('context') or '')[:500]  # Truncate long context
+            )
+            for spec in specs
+        ])
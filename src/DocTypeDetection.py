@@ -1,7 +1,12 @@
 from dataclasses import dataclass
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Set
 from enum import Enum
-import re
+import numpy as np
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 
 class DrawingType(Enum):
     PUMP_STATION = "pump_station"
@@ -30,77 +35,128 @@ class DrawingClassification:
     has_specifications: bool
     confidence: float
 
-def classify_drawing(ocr_text: str, text_items: List[Dict]) -> DrawingClassification:
+# Keyword detection
+TYPE_KEYWORDS = {
+    DrawingType.PUMP_STATION: ['PUMP STATION', 'PUMP', 'WETWELL', 'GPM', 'TDH'],
+    DrawingType.STANDARDS_DETAIL: ['STANDARD DETAIL', 'ACCORDANCE WITH', 'MINIMUM', 'SEPARATION'],
+    DrawingType.PIPING_DIAGRAM: ['P&ID', 'PIPING', 'VALVE', 'FLOW'],
+    DrawingType.FLOOR_PLAN: ['FLOOR PLAN', 'ROOM', 'ELEVATION', 'LEVEL'],
+    DrawingType.SITE_PLAN: ['SITE PLAN', 'PROPERTY LINE', 'LOT', 'SETBACK'],
+    DrawingType.SPECIFICATION_TABLE: ['SPECIFICATION', 'REQUIREMENT', 'TABLE']
+}
+
+DISCIPLINE_KEYWORDS = {
+    DrawingDiscipline.MECHANICAL: ['MECHANICAL', 'HVAC', 'PUMP', 'VALVE', 'GPM'],
+    DrawingDiscipline.CIVIL: ['CIVIL', 'SEWER', 'STORM', 'WATER MAIN', 'UTILITY'],
+    DrawingDiscipline.ELECTRICAL: ['ELECTRICAL', 'PANEL', 'CIRCUIT', 'VOLTAGE'],
+    DrawingDiscipline.STRUCTURAL: ['STRUCTURAL', 'BEAM', 'COLUMN', 'FOUNDATION'],
+    DrawingDiscipline.PLUMBING: ['PLUMBING', 'SANITARY', 'WASTE', 'FIXTURE']
+}
+
+# Structural element markers ('NOTES:' is already covered by 'NOTE')
+ELEMENT_KEYWORDS = {
+    'has_table': ['TABLE'],
+    'has_notes': ['NOTE'],
+    'has_legend': ['LEGEND', 'KEY:'],
+    'has_specifications': ['SPEC', 'REQUIREMENT']  # 'SPEC' covers 'SPECIFICATION'
+}
+
+# Every keyword across the groups, each listed once
+_KEYWORDS = tuple(sorted({
+    kw
+    for group in (TYPE_KEYWORDS, DISCIPLINE_KEYWORDS, ELEMENT_KEYWORDS)
+    for kws in group.values()
+    for kw in kws
+}))
+
+def _build_keyword_automaton():
     """
-    Determine what type of drawing this is based on content
+    Compile every keyword once so classification is a single pass over the text.
+    Returns None when pyahocorasick is not installed
     """
-    text_upper = ocr_text.upper()
-    
-    # Keyword detection
-    keywords = {
-        DrawingType.PUMP_STATION: ['PUMP STATION', 'PUMP', 'WETWELL', 'GPM', 'TDH'],
-        DrawingType.STANDARDS_DETAIL: ['STANDARD DETAIL', 'ACCORDANCE WITH', 'MINIMUM', 'SEPARATION'],
-        DrawingType.PIPING_DIAGRAM: ['P&ID', 'PIPING', 'VALVE', 'FLOW'],
-        DrawingType.FLOOR_PLAN: ['FLOOR PLAN', 'ROOM', 'ELEVATION', 'LEVEL'],
-        DrawingType.SITE_PLAN: ['SITE PLAN', 'PROPERTY LINE', 'LOT', 'SETBACK'],
-        DrawingType.SPECIFICATION_TABLE: ['SPECIFICATION', 'REQUIREMENT', 'TABLE']
-    }
-    
-    discipline_keywords = {
-        DrawingDiscipline.MECHANICAL: ['MECHANICAL', 'HVAC', 'PUMP', 'VALVE', 'GPM'],
-        DrawingDiscipline.CIVIL: ['CIVIL', 'SEWER', 'STORM', 'WATER MAIN', 'UTILITY'],
-        DrawingDiscipline.ELECTRICAL: ['ELECTRICAL', 'PANEL', 'CIRCUIT', 'VOLTAGE'],
-        DrawingDiscipline.STRUCTURAL: ['STRUCTURAL', 'BEAM', 'COLUMN', 'FOUNDATION'],
-        DrawingDiscipline.PLUMBING: ['PLUMBING', 'SANITARY', 'WASTE', 'FIXTURE']
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for kw in _KEYWORDS:
+        automaton.add_word(kw, kw)
+    automaton.make_automaton()
+    return automaton
+
+_KEYWORD_AUTOMATON = _build_keyword_automaton()
+
+def find_keywords(text_upper: str) -> Set[str]:
+    """
+    Return the set of known keywords that occur in the (uppercased) text
+    """
+    if _KEYWORD_AUTOMATON is not None:
+        return {kw for _, kw in _KEYWORD_AUTOMATON.iter(text_upper)}
+    return {kw for kw in _KEYWORDS if kw in text_upper}
+
+def _score_keywords(keyword_groups: Dict, found: Set[str]) -> Dict:
+    return {
+        category: sum(1 for kw in kws if kw in found)
+        for category, kws in keyword_groups.items()
     }
-    
+
+def classify_drawing(ocr_text: str, text_items: List[Dict],
+                     text_upper: Optional[str] = None) -> DrawingClassification:
+    """
+    Determine what type of drawing this is based on content
+
+    Pass text_upper when the caller already has ocr_text uppercased
+    """
+    if text_upper is None:
+        text_upper = ocr_text.upper()
+    found = find_keywords(text_upper)
+
     # Score each type
-    type_scores = {}
-    for draw_type, kws in keywords.items():
-        score = sum(1 for kw in kws if kw in text_upper)
-        type_scores[draw_type] = score
-    
+    type_scores = _score_keywords(TYPE_KEYWORDS, found)
+
     detected_type = max(type_scores, key=type_scores.get)
     if type_scores[detected_type] == 0:
         detected_type = DrawingType.UNKNOWN
-    
+
     # Detect discipline
-    disc_scores = {}
-    for disc, kws in discipline_keywords.items():
-        score = sum(1 for kw in kws if kw in text_upper)
-        disc_scores[disc] = score
-    
+    disc_scores = _score_keywords(DISCIPLINE_KEYWORDS, found)
+
     detected_disc = max(disc_scores, key=disc_scores.get)
     if disc_scores[detected_disc] == 0:
         detected_disc = DrawingDiscipline.UNKNOWN
-    
+
     # Detect structural elements
-    has_table = 'TABLE' in text_upper or detect_table_structure(text_items)
-    has_notes = 'NOTE' in text_upper or 'NOTES:' in text_upper
-    has_legend = 'LEGEND' in text_upper or 'KEY:' in text_upper
-    has_specifications = bool(re.search(r'SPEC|SPECIFICATION|REQUIREMENT', text_upper))
-    
+    element_flags = {
+        flag: any(kw in found for kw in kws)
+        for flag, kws in ELEMENT_KEYWORDS.items()
+    }
+    has_table = element_flags['has_table'] or detect_table_structure(text_items)
+
     return DrawingClassification(
         drawing_type=detected_type,
         discipline=detected_disc,
         has_table=has_table,
-        has_notes=has_notes,
-        has_legend=has_legend,
-        has_specifications=has_specifications,
-        confidence=type_scores[detected_type] / 10  # Normalize
+        has_notes=element_flags['has_notes'],
+        has_legend=element_flags['has_legend'],
+        has_specifications=element_flags['has_specifications'],
+        confidence=type_scores.get(detected_type, 0) / 10  # Normalize
     )
 
 def detect_table_structure(text_items: List[Dict]) -> bool:
     """
     Detect if text is arranged in a table-like structure
     """
+    # A column needs more than 3 aligned items
+    if len(text_items) < 4:
+        return False
+
     # Check for aligned columns (similar x-coordinates)
-    x_coords = [item['bbox']['left'] for item in text_items]
-    
+    x_coords = np.fromiter(
+        (item['bbox']['left'] for item in text_items),
+        dtype=np.float64,
+        count=len(text_items)
+    )
+
     # Count how many items share similar x-coordinates (within 5% tolerance)
-    from collections import Counter
-    x_rounded = [round(x, 1) for x in x_coords]
-    counts = Counter(x_rounded)
-    
+    _, counts = np.unique(np.round(x_coords, 1), return_counts=True)
+
     # If multiple items share x-coordinates, likely a table
-    return any(count > 3 for count in counts.values())
\ No newline at end of file
+    return bool((counts > 3).any())
\ No newline at end of file
@@ -1,4 +1,4 @@
-from DocTypeDetection import DrawingType
+from DocTypeDetection import DrawingType, DrawingDiscipline
 from parsers.StandarDetailsParser import StandardsDetailParser
 from parsers.PumpStationParser import PumpStationParser
 from extractors.TitleBlockExtractor import TitleBlockExtractor
@@ -6,10 +6,45 @@ from extractors.NotesExtractor import NotesExtractor
 from extractors.SpecificationExtractor import SpecificationExtractor
 from extractors.ReferenceExtractor import ReferenceExtractor
 from extractors.TableExtractor import TableExtractor
-from typing import List, Dict, Union
+from typing import List, Dict, Optional, Union
 from DocTypeDetection import classify_drawing
 from Config import config
+from LogConfig import get_logger
 from io import BytesIO
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+import os
+import threading
+import time
+import uuid
+
+logger = get_logger('parser')
+
+# Vision API accepts at most 16 images per batch_annotate_images request
+VISION_BATCH_SIZE = 16
+
+# Sample OCR lines used by warmup() to exercise classification and every extractor
+WARMUP_LINES = [
+    'PUMP STATION DETAILS',
+    'NOTES:',
+    '1. ALL PIPE SHALL BE 8" PVC PER ASTM D3034. SEE DETAIL 3/C-501.',
+    '2. MINIMUM 10 FT SEPARATION FROM WATER MAIN.',
+    'PUMP MODEL: S4L  FLOW: 250 GPM  TDH: 45 FT',
+    'DWG NO. C-101  SCALE: 1"=20\'  DATE: 01/02/2024  REV 2  SHEET 3 OF 10'
+]
+
+
+def _uuid7() -> uuid.UUID:
+    """
+    Time-ordered UUID (version 7, RFC 9562): 48-bit Unix milliseconds followed by
+    random bits. Uses uuid.uuid7 where the standard library has it (3.14+)
+    """
+    if hasattr(uuid, 'uuid7'):
+        return uuid.uuid7()
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10), 'big')
+    value = value & ~(0xF << 76) | (0x7 << 76)  # version 7
+    value = value & ~(0x3 << 62) | (0x2 << 62)  # RFC 4122 variant
+    return uuid.UUID(int=value)
 
 
 class DrawingParser:
@@ -30,6 +65,14 @@ class DrawingParser:
             ReferenceExtractor(),
             TableExtractor()
         ]
+        
+        # Whether to include raw OCR data in output (resolved once by Config)
+        self._include_raw_flag = config.INCLUDE_RAW_OCR
+        
+        # OCR clients are created on first use and reused across parses
+        self._aws_clients = {}
+        self._vision_client = None
+        self._client_lock = threading.Lock()
     
     def parse(self, pdf_input: Union[str, bytes], ocr_method: str = 'textract', filename: str = None) -> Dict:
         """
@@ -40,46 +83,76 @@ class DrawingParser:
             ocr_method: 'textract' or 'vision'
             filename: Optional filename for metadata (used when pdf_input is bytes)
         """
-        # Step 1: OCR Extraction
-        print(f"Extracting text using {ocr_method}...")
-        if ocr_method == 'textract':
-            ocr_results = self._extract_with_textract(pdf_input, filename or "document.pdf")
+        return self.analyze(self.extract_text(pdf_input, ocr_method, filename))
+    
+    def extract_text(self, pdf_input: Union[str, bytes], ocr_method: str = 'textract',
+                     filename: str = None) -> Dict:
+        """
+        Run OCR only (mostly waiting on the Textract/Vision API); analyze() does the rest
+        """
+        # Step 1: OCR Extraction (skipped when the PDF has no pages). The count
+        # is passed on so Textract does not parse the PDF a second time
+        num_pages = self._count_pages(pdf_input)
+        if num_pages == 0:
+            logger.info("PDF has no pages, skipping OCR")
+            ocr_results = {'text_items': [], 'tables': [], 'key_values': []}
+        elif ocr_method == 'textract':
+            logger.info("Extracting text using %s...", ocr_method)
+            ocr_results = self._extract_with_textract(pdf_input, filename or "document.pdf",
+                                                      num_pages=num_pages)
         else:
+            logger.info("Extracting text using %s...", ocr_method)
             ocr_results = self._extract_with_vision(pdf_input, filename or "document.pdf")
 
+        return ocr_results
+    
+    def analyze(self, ocr_results: Dict) -> Dict:
+        """
+        Classify and extract data from OCR results (everything after the OCR call)
+        """
         text_items = ocr_results['text_items']
-        full_text = ' '.join([item['text'] for item in text_items])
+        if not text_items:
+            logger.info("No text found, skipping analysis")
+            return self._empty_result(ocr_results)
+        
+        full_text = ' '.join(map(itemgetter('text'), text_items))
+        text_upper = full_text.upper()
         
         # Step 2: Classify drawing
-        print("Classifying drawing type...")
-        classification = classify_drawing(full_text, text_items)
+        logger.debug("Classifying drawing type...")
+        classification = classify_drawing(full_text, text_items, text_upper=text_upper)
         
-        print(f"Detected: {classification.drawing_type.value} "
-              f"({classification.discipline.value})")
+        logger.info("Detected: %s (%s)", classification.drawing_type.value,
+                    classification.discipline.value)
         
         # Step 3: Run universal extractors
-        print("Running universal extractors...")
+        logger.debug("Running universal extractors...")
         universal_data = {}
         zones = self._identify_basic_zones(text_items)
+        # Joined once here rather than by every text-based extractor
+        zones['_full_text'] = full_text
+        zones['_full_text_upper'] = text_upper
         
         for extractor in self.universal_extractors:
-            extractor_name = extractor.__class__.__name__.replace('Extractor', '').lower()
+            extractor_name = extractor.result_key
             try:
                 universal_data[extractor_name] = extractor.extract(text_items, zones)
             except Exception as e:
-                print(f"Warning: {extractor_name} failed: {e}")
+                logger.warning("%s failed: %s", extractor_name, e)
                 universal_data[extractor_name] = None
         
         # Step 4: Run specialized parser if available
-        print("Running specialized parser...")
+        logger.debug("Running specialized parser...")
         specialized_data = {}
         
         if classification.drawing_type in self.parsers:
             parser = self.parsers[classification.drawing_type]
             try:
-                specialized_data = parser.parse(text_items)
+                # Reuses the universal extractor results and the joined text
+                # instead of computing them again
+                specialized_data = parser.parse(text_items, universal_data, full_text=full_text)
             except Exception as e:
-                print(f"Warning: Specialized parser failed: {e}")
+                logger.warning("Specialized parser failed: %s", e)
         
         # Step 5: Combine results
         result = {
@@ -93,25 +166,145 @@ class DrawingParser:
             },
             'universal_data': universal_data,
             'specialized_data': specialized_data,
-            'raw_ocr': ocr_results if self._include_raw() else None
+            'raw_ocr': ocr_results if self._include_raw_flag else None
         }
         
         return result
     
+    def _empty_result(self, ocr_results: Dict) -> Dict:
+        """
+        Result for a document without any OCR text (empty or blank PDF)
+        """
+        return {
+            'classification': {
+                'type': DrawingType.UNKNOWN.value,
+                'discipline': DrawingDiscipline.UNKNOWN.value,
+                'confidence': 0.0,
+                'has_table': False,
+                'has_notes': False,
+                'has_legend': False
+            },
+            'universal_data': {
+                'titleblock': {},
+                'notes': [],
+                'specification': [],
+                'reference': [],
+                'table': []
+            },
+            'specialized_data': {},
+            'raw_ocr': ocr_results if self._include_raw_flag else None,
+            'empty_document': True
+        }
+    
+    @staticmethod
+    def _count_pages(pdf_input: Union[str, bytes]):
+        """
+        Page count from the PDF structure, or None if it cannot be read
+        (left for the OCR backend to handle)
+        """
+        from PyPDF2 import PdfReader
+        
+        try:
+            source = BytesIO(pdf_input) if isinstance(pdf_input, bytes) else pdf_input
+            return len(PdfReader(source, strict=False).pages)
+        except Exception:
+            return None
+    
+    def warmup(self) -> Dict:
+        """
+        Pay first-request costs up front: OCR client construction (botocore service
+        models, credential lookup) and a dry run of classification, the extractors
+        and the specialized parser on sample text. Never raises; returns the sample result
+        """
+        try:
+            self._get_aws_client('textract')
+            self._get_aws_client('s3')
+        except Exception as e:
+            logger.warning("Could not create AWS clients during warmup: %s", e)
+        
+        try:
+            self._get_vision_client()
+        except ImportError:
+            pass
+        except Exception as e:
+            logger.warning("Could not create Vision client during warmup: %s", e)
+        
+        text_items = [
+            {
+                'text': line,
+                'confidence': 99.0,
+                'bbox': {'left': 0.05, 'top': 0.1 + 0.12 * i, 'width': 0.9, 'height': 0.02},
+                'page': 1
+            }
+            for i, line in enumerate(WARMUP_LINES)
+        ]
+        try:
+            return self.analyze({'text_items': text_items, 'tables': [], 'key_values': []})
+        except Exception as e:
+            logger.warning("Warmup parse failed: %s", e)
+            return {}
+    
     def _identify_basic_zones(self, text_items: List[Dict]) -> Dict:
         """Basic zone identification for universal extractors"""
-        page_height = max([item['bbox']['top'] + item['bbox'].get('height', 0) 
-                          for item in text_items])
-        
+        tops = [item['bbox']['top'] for item in text_items]
+        page_height = max([top + item['bbox'].get('height', 0)
+                          for top, item in zip(tops, text_items)])
+        top_limit = page_height * 0.15
+        bottom_limit = page_height * 0.85
+
+        top, middle, bottom = [], [], []
+        for item_top, item in zip(tops, text_items):
+            if item_top < top_limit:
+                top.append(item)
+            elif item_top <= bottom_limit:
+                middle.append(item)
+            else:
+                bottom.append(item)
+
         zones = {
-            'top': [item for item in text_items if item['bbox']['top'] < page_height * 0.15],
-            'middle': [item for item in text_items if page_height * 0.15 <= item['bbox']['top'] <= page_height * 0.85],
-            'bottom': [item for item in text_items if item['bbox']['top'] > page_height * 0.85]
+            'top': top,
+            'middle': middle,
+            'bottom': bottom
         }
-        
+
         return zones
     
-    def _extract_with_textract(self, pdf_input: Union[str, bytes], filename: str = "document.pdf") -> Dict:
+    def _get_aws_client(self, service: str):
+        """
+        Return a cached boto3 client for the service, creating it on first use
+        (boto3 clients are thread-safe and keep their HTTP connection pool;
+        creating them is not, hence the lock)
+        """
+        client = self._aws_clients.get(service)
+        if client is None:
+            import boto3
+            
+            with self._client_lock:
+                client = self._aws_clients.get(service)
+                if client is None:
+                    client = boto3.client(
+                        service,
+                        aws_access_key_id=config.AWS_ACCESS_KEY_ID,
+                        aws_secret_access_key=config.AWS_SECRET_ACCESS_KEY,
+                        region_name=config.AWS_DEFAULT_REGION
+                    )
+                    self._aws_clients[service] = client
+        return client
+    
+    def _get_vision_client(self):
+        """
+        Return the cached Vision ImageAnnotatorClient, creating it on first use
+        """
+        if self._vision_client is None:
+            from google.cloud import vision
+            
+            with self._client_lock:
+                if self._vision_client is None:
+                    self._vision_client = vision.ImageAnnotatorClient()
+        return self._vision_client
+    
+    def _extract_with_textract(self, pdf_input: Union[str, bytes], filename: str = "document.pdf",
+                               num_pages: Optional[int] = None) -> Dict:
         """
         Extract text using AWS Textract
         Automatically handles multi-page PDFs using async API
@@ -119,26 +312,24 @@ class DrawingParser:
         Args:
             pdf_input: Either a file path (str) or file content (bytes)
             filename: Optional filename for S3 key (used for async processing)
+            num_pages: Page count if the caller already read it
         """
-        import boto3
         from PyPDF2 import PdfReader
-        import time
         from pathlib import Path
         
-        # Get PDF bytes and check page count
+        # Get PDF bytes
         if isinstance(pdf_input, bytes):
             pdf_bytes = pdf_input
-            reader = PdfReader(BytesIO(pdf_bytes))
         else:
             # It's a file path
             filename = Path(pdf_input).name  # Use actual filename from path
             with open(pdf_input, 'rb') as f:
                 pdf_bytes = f.read()
-            reader = PdfReader(BytesIO(pdf_bytes))
         
-        num_pages = len(reader.pages)
+        if num_pages is None:
+            num_pages = len(PdfReader(BytesIO(pdf_bytes)).pages)
         
-        print(f"PDF has {num_pages} page(s)")
+        logger.info("PDF has %d page(s)", num_pages)
         
         # For single-page PDFs, use synchronous API
         if num_pages == 1:
@@ -146,7 +337,6 @@ class DrawingParser:
         
         # For multi-page PDFs, use asynchronous API with S3
         return self._extract_with_textract_async(pdf_bytes, filename)
-        return self._extract_with_textract_async(pdf_bytes)
     
     def _extract_with_textract_sync(self, pdf_bytes: bytes) -> Dict:
         """
@@ -156,15 +346,8 @@ class DrawingParser:
             pdf_bytes: PDF file content as bytes
         """
 
-        import boto3
+        textract = self._get_aws_client('textract')
         
-        textract = boto3.client(
-            'textract',
-            aws_access_key_id=config.AWS_ACCESS_KEY_ID,
-            aws_secret_access_key=config.AWS_SECRET_ACCESS_KEY,
-            region_name=config.AWS_DEFAULT_REGION
-        )
-
         # Call Textract with bytes
         try:
             response = textract.analyze_document(
@@ -172,7 +355,7 @@ class DrawingParser:
                 FeatureTypes=['TABLES', 'FORMS']
             )
         except Exception as e:
-            print(f"Textract analyze_document error: {e}")
+            logger.warning("Textract analyze_document error: %s", e)
             # Fallback to detect_document_text if analyze fails
             response = textract.detect_document_text(
                 Document={'Bytes': pdf_bytes}
@@ -189,10 +372,6 @@ class DrawingParser:
             pdf_bytes: PDF file content as bytes
             filename: Optional filename for S3 key
         """
-        import boto3
-        import time
-        import uuid
-        
         if not config.AWS_TEXTRACT_S3_BUCKET:
             raise ValueError(
                 "AWS_TEXTRACT_S3_BUCKET environment variable not set. "
@@ -200,24 +379,14 @@ class DrawingParser:
                 "Either set AWS_TEXTRACT_S3_BUCKET or use single-page PDFs."
             )
         
-        # Initialize AWS clients
-        s3 = boto3.client(
-            's3',
-            aws_access_key_id=config.AWS_ACCESS_KEY_ID,
-            aws_secret_access_key=config.AWS_SECRET_ACCESS_KEY,
-            region_name=config.AWS_DEFAULT_REGION
-        )
-        
-        textract = boto3.client(
-            'textract',
-            aws_access_key_id=config.AWS_ACCESS_KEY_ID,
-            aws_secret_access_key=config.AWS_SECRET_ACCESS_KEY,
-            region_name=config.AWS_DEFAULT_REGION
-        )
+        # Reuse cached AWS clients
+        s3 = self._get_aws_client('s3')
+        textract = self._get_aws_client('textract')
         
-        # Upload PDF to S3 with unique key
-        s3_key = f"textract-input/{uuid.uuid4()}_{filename}"
-        print(f"Uploading to S3: s3://{config.AWS_TEXTRACT_S3_BUCKET}/{s3_key}")
+        # Upload PDF to S3 with unique, time-ordered key (leftover inputs from a
+        # failed cleanup list oldest-first)
+        s3_key = f"textract-input/{_uuid7()}_{filename}"
+        logger.info("Uploading to S3: s3://%s/%s", config.AWS_TEXTRACT_S3_BUCKET, s3_key)
         
         s3.put_object(
             Bucket=config.AWS_TEXTRACT_S3_BUCKET,
@@ -225,25 +394,45 @@ class DrawingParser:
             Body=pdf_bytes
         )
         
-        # Start async document analysis
-        print("Starting Textract async analysis...")
-        response = textract.start_document_analysis(
-            DocumentLocation={
-                'S3Object': {
-                    'Bucket': config.AWS_TEXTRACT_S3_BUCKET,
-                    'Name': s3_key
-                }
-            },
-            FeatureTypes=['TABLES', 'FORMS']
-        )
+        try:
+            # Start async document analysis
+            logger.info("Starting Textract async analysis...")
+            response = textract.start_document_analysis(
+                DocumentLocation={
+                    'S3Object': {
+                        'Bucket': config.AWS_TEXTRACT_S3_BUCKET,
+                        'Name': s3_key
+                    }
+                },
+                FeatureTypes=['TABLES', 'FORMS']
+            )
+            
+            job_id = response['JobId']
+            logger.info("Job ID: %s", job_id)
+            logger.info("Waiting for Textract to complete...")
+            
+            all_blocks = self._poll_textract_job(textract, job_id)
+        finally:
+            # Clean up S3 file whether the job succeeded, failed or timed out
+            try:
+                s3.delete_object(Bucket=config.AWS_TEXTRACT_S3_BUCKET, Key=s3_key)
+                logger.info("Cleaned up S3 file: %s", s3_key)
+            except Exception:
+                pass
         
-        job_id = response['JobId']
-        print(f"Job ID: {job_id}")
-        print("Waiting for Textract to complete...")
+        return self._parse_textract_response({'Blocks': all_blocks})
+    
+    def _poll_textract_job(self, textract, job_id: str, max_wait: float = 300) -> List[Dict]:
+        """
+        Poll an async Textract job with exponential backoff and return all blocks
         
-        # Poll for completion
-        max_wait = 300  # 5 minutes max
-        wait_interval = 5  # Check every 5 seconds
+        Args:
+            textract: Textract client
+            job_id: Job ID returned by start_document_analysis
+            max_wait: Maximum seconds to wait for the job (5 minutes by default)
+        """
+        wait_interval = 1  # Start short; most small jobs finish within seconds
+        max_interval = 10
         elapsed = 0
         
         while elapsed < max_wait:
@@ -251,7 +440,7 @@ class DrawingParser:
             status = result['JobStatus']
             
             if status == 'SUCCEEDED':
-                print("✅ Textract analysis completed!")
+                logger.info("Textract analysis completed")
                 
                 # Get all pages if there are multiple
                 all_blocks = result.get('Blocks', [])
@@ -265,28 +454,17 @@ class DrawingParser:
                     all_blocks.extend(result.get('Blocks', []))
                     next_token = result.get('NextToken')
                 
-                # Clean up S3 file
-                try:
-                    s3.delete_object(Bucket=config.AWS_TEXTRACT_S3_BUCKET, Key=s3_key)
-                    print(f"Cleaned up S3 file: {s3_key}")
-                except:
-                    pass
-                
-                return self._parse_textract_response({'Blocks': all_blocks})
+                return all_blocks
                 
             elif status == 'FAILED':
                 error_msg = result.get('StatusMessage', 'Unknown error')
-                # Clean up S3 file
-                try:
-                    s3.delete_object(Bucket=config.AWS_TEXTRACT_S3_BUCKET, Key=s3_key)
-                except:
-                    pass
                 raise Exception(f"Textract job failed: {error_msg}")
             
             # Still in progress
             time.sleep(wait_interval)
             elapsed += wait_interval
-            print(f"Status: {status} (waited {elapsed}s)")
+            wait_interval = min(wait_interval * 2, max_interval, max_wait - elapsed)
+            logger.info("Status: %s (waited %ss)", status, elapsed)
         
         # Timeout
         raise Exception(f"Textract job timed out after {max_wait} seconds")
@@ -301,8 +479,8 @@ class DrawingParser:
         tables = []
         key_values = []
         
-        # Process blocks
-        block_map = {block['Id']: block for block in blocks}
+        # Id lookup is only needed to resolve table cells, so build it lazily
+        block_map = None
         
         for block in blocks:
             block_type = block.get('BlockType')
@@ -325,7 +503,9 @@ class DrawingParser:
                 })
             
             elif block_type == 'TABLE':
-                # Parse table structure
+                # Parse table structure (cells may follow the table block)
+                if block_map is None:
+                    block_map = {b['Id']: b for b in blocks}
                 table_data = self._parse_textract_table(block, block_map)
                 if table_data:
                     tables.append(table_data)
@@ -360,36 +540,32 @@ class DrawingParser:
         if not table_cells:
             return None
         
-        # Organize cells into rows and columns
-        rows = {}
+        # First pass: collect cell text and table bounds (indices are 1-based)
+        cells = []
+        num_rows = 0
+        num_cols = 0
         for cell in table_cells:
-            row_index = cell.get('RowIndex', 0)
-            col_index = cell.get('ColumnIndex', 0)
-            
-            if row_index not in rows:
-                rows[row_index] = {}
+            row_index = cell.get('RowIndex', 1)
+            col_index = cell.get('ColumnIndex', 1)
             
             # Get cell text
-            cell_text = ''
+            words = []
             for relationship in cell.get('Relationships', []):
                 if relationship.get('Type') == 'CHILD':
                     for word_id in relationship.get('Ids', []):
                         word_block = block_map.get(word_id)
                         if word_block and word_block.get('BlockType') == 'WORD':
-                            cell_text += word_block.get('Text', '') + ' '
+                            words.append(word_block.get('Text', ''))
             
-            rows[row_index][col_index] = cell_text.strip()
-        
-        # Convert to list format
-        sorted_rows = sorted(rows.keys())
-        table_data = []
+            cells.append((row_index, col_index, ' '.join(words).strip()))
+            num_rows = max(num_rows, row_index)
+            num_cols = max(num_cols, col_index)
         
-        for row_idx in sorted_rows:
-            row_data = []
-            sorted_cols = sorted(rows[row_idx].keys())
-            for col_idx in sorted_cols:
-                row_data.append(rows[row_idx].get(col_idx, ''))
-            table_data.append(row_data)
+        # Second pass: write cells straight into a preallocated grid
+        table_data = [[''] * num_cols for _ in range(num_rows)]
+        for row_index, col_index, cell_text in cells:
+            if row_index >= 1 and col_index >= 1:
+                table_data[row_index - 1][col_index - 1] = cell_text
         
         if not table_data:
             return None
@@ -404,81 +580,56 @@ class DrawingParser:
     def _extract_with_vision(self, pdf_input: Union[str, bytes], filename: str = "document.pdf") -> Dict:
         """
         Extract text using Google Cloud Vision API
+        Pages are rendered and PNG-encoded in parallel, then sent to Vision
+        in batches of up to VISION_BATCH_SIZE images per request
         
         Args:
             pdf_input: Either a file path (str) or file content (bytes)
-            filename: Optional filename for temporary file naming
+            filename: Optional filename (kept for parity with the Textract path)
         """
         from google.cloud import vision
-        import io
         from pdf2image import convert_from_path, convert_from_bytes
-        import tempfile
-        import os
         
-        client = vision.ImageAnnotatorClient()
+        client = self._get_vision_client()
+        feature = vision.Feature(type_=vision.Feature.Type.DOCUMENT_TEXT_DETECTION)
         
         # Convert PDF to images (Vision API works better with images)
+        workers = min(VISION_BATCH_SIZE, os.cpu_count() or 1)
         if isinstance(pdf_input, bytes):
-            images = convert_from_bytes(pdf_input, dpi=300)
+            images = convert_from_bytes(pdf_input, dpi=300, thread_count=workers)
         else:
-            images = convert_from_path(pdf_input, dpi=300)
+            images = convert_from_path(pdf_input, dpi=300, thread_count=workers)
+        
+        batches = [
+            images[start:start + VISION_BATCH_SIZE]
+            for start in range(0, len(images), VISION_BATCH_SIZE)
+        ]
+        
+        def annotate_batch(batch):
+            # PNG encoding releases the GIL, so batches encode concurrently
+            requests = [
+                vision.AnnotateImageRequest(
+                    image=vision.Image(content=self._encode_png(image)),
+                    features=[feature]
+                )
+                for image in batch
+            ]
+            return client.batch_annotate_images(requests=requests).responses
+        
+        # Batches are annotated concurrently so encoding overlaps API round-trips
+        with ThreadPoolExecutor(max_workers=max(1, min(workers, len(batches)))) as executor:
+            batch_responses = list(executor.map(annotate_batch, batches))
         
         all_text_items = []
         page_num = 1
         
-        for image in images:
-            # Save image to bytes
-            with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as temp_file:
-                temp_path = temp_file.name
-                image.save(temp_path, 'PNG')
-            
-            try:
-                with io.open(temp_path, 'rb') as image_file:
-                    content = image_file.read()
-                
-                vision_image = vision.Image(content=content)
-                
-                # Perform text detection
-                response = client.document_text_detection(image=vision_image)
-                
+        for responses in batch_responses:
+            for response in responses:
                 if response.error.message:
                     raise Exception(f'Vision API error: {response.error.message}')
                 
-                # Parse response
-                for page in response.full_text_annotation.pages:
-                    page_height = page.height
-                    page_width = page.width
-                    
-                    for block in page.blocks:
-                        for paragraph in block.paragraphs:
-                            for word in paragraph.words:
-                                # Combine word symbols into text
-                                word_text = ''.join([
-                                    symbol.text for symbol in word.symbols
-                                ])
-                                
-                                # Get bounding box (normalized)
-                                vertices = word.bounding_box.vertices
-                                
-                                all_text_items.append({
-                                    'text': word_text,
-                                    'confidence': word.confidence,
-                                    'bbox': {
-                                        'left': vertices[0].x / page_width if page_width > 0 else 0,
-                                        'top': vertices[0].y / page_height if page_height > 0 else 0,
-                                        'width': (vertices[1].x - vertices[0].x) / page_width if page_width > 0 else 0,
-                                        'height': (vertices[2].y - vertices[0].y) / page_height if page_height > 0 else 0
-                                    },
-                                    'page': page_num
-                                })
-            finally:
-                # Clean up temporary image file
-                try:
-                    os.unlink(temp_path)
-                except:
-                    pass
-            
-            page_num += 1
+                all_text_items.extend(self._parse_vision_response(response, page_num))
+                page_num += 1
         
         return {
             'text_items': all_text_items,
@@ -487,10 +638,44 @@ class DrawingParser:
             'raw_response': None
         }
     
-    def _include_raw(self) -> bool:
+    @staticmethod
+    def _encode_png(image) -> bytes:
+        """Encode a rendered page image to PNG bytes in memory"""
+        buffer = BytesIO()
+        image.save(buffer, 'PNG')
+        return buffer.getvalue()
+    
+    def _parse_vision_response(self, response, page_num: int) -> List[Dict]:
         """
-        Determine whether to include raw OCR data in output
-        Can be made configurable via environment variable or config file
+        Parse a single Vision annotation response into standardized text items
         """
-        import os
-        return os.environ.get('INCLUDE_RAW_OCR', 'false').lower() == 'true'
\ No newline at end of file
+        text_items = []
+        
+        for page in response.full_text_annotation.pages:
+            page_height = page.height
+            page_width = page.width
+            
+            for block in page.blocks:
+                for paragraph in block.paragraphs:
+                    for word in paragraph.words:
+                        # Combine word symbols into text
+                        word_text = ''.join([
+                            symbol.text for symbol in word.symbols
+                        ])
+                        
+                        # Get bounding box (normalized)
+                        vertices = word.bounding_box.vertices
+                        
+                        text_items.append({
+                            'text': word_text,
+                            'confidence': word.confidence,
+                            'bbox': {
+                                'left': vertices[0].x / page_width if page_width > 0 else 0,
+                                'top': vertices[0].y / page_height if page_height > 0 else 0,
+                                'width': (vertices[1].x - vertices[0].x) / page_width if page_width > 0 else 0,
+                                'height': (vertices[2].y - vertices[0].y) / page_height if page_height > 0 else 0
+                            },
+                            'page': page_num
+                        })
+        
+        return text_items
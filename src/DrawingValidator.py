@@ -1,4 +1,8 @@
 from typing import Dict, List
+import re
+
+# Plain decimal numbers as produced by the extractors (e.g. "6", "2.5", "5.", ".5")
+_NUMBER_RE = re.compile(r'\s*[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?\s*')
 
 class ValidationResult:
     def __init__(self):
@@ -12,6 +16,21 @@ class ValidationResult:
     
     def add_warning(self, message: str):
         self.warnings.append(message)
+    
+    def to_dict(self) -> Dict:
+        return {
+            'is_valid': self.is_valid,
+            'errors': self.errors,
+            'warnings': self.warnings
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'ValidationResult':
+        result = cls()
+        result.is_valid = data['is_valid']
+        result.errors = list(data['errors'])
+        result.warnings = list(data['warnings'])
+        return result
 
 class DrawingValidator:
     """Validate extracted data"""
@@ -20,12 +39,19 @@ class DrawingValidator:
     def validate(extracted_data: Dict) -> ValidationResult:
         result = ValidationResult()
         
+        # Nothing to check on a document without text
+        if extracted_data.get('empty_document'):
+            result.add_warning("empty PDF")
+            return result
+        
+        universal_data = extracted_data.get('universal_data') or {}
+        title_block = universal_data.get('titleblock') or {}
+        
         # Check for title block
-        if not extracted_data.get('universal_data', {}).get('titleblock'):
+        if not title_block:
             result.add_warning("No title block information found")
         
         # Check for drawing number
-        title_block = extracted_data.get('universal_data', {}).get('titleblock', {})
         if not title_block.get('drawing_number'):
             result.add_error("Missing drawing number")
         
@@ -34,12 +60,11 @@ class DrawingValidator:
             result.add_warning("No scale information found")
         
         # Validate measurements
-        specs = extracted_data.get('universal_data', {}).get('specification', [])
+        specs = universal_data.get('specification') or []
         for spec in specs:
             if spec.get('type') == 'measurement':
-                try:
-                    float(spec.get('value', ''))
-                except ValueError:
-                    result.add_error(f"Invalid measurement value: {spec.get('value')}")
+                value = spec.get('value', '')
+                if not _NUMBER_RE.fullmatch(str(value)):
+                    result.add_error(f"Invalid measurement value: {value}")
         
         return result
\ No newline at end of file
@@ -0,0 +1,61 @@
+from logging.handlers import QueueHandler, QueueListener
+import atexit
+import logging
+import os
+import queue
+import sys
+import threading
+
+LOGGER_NAME = 'blueparser'
+
+# Process that owns the running QueueListener (forked workers need their own)
+_configured_pid = None
+
+# Threads of one process may call setup_logging at the same time
+_setup_lock = threading.Lock()
+
+def _reset_setup_lock():
+    """A forked child gets a fresh lock, in case another thread held it at fork time"""
+    global _setup_lock
+    _setup_lock = threading.Lock()
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_setup_lock)
+
+def setup_logging(level: str = 'INFO') -> logging.Logger:
+    """
+    Route the 'blueparser' logger tree through a QueueHandler so formatting and
+    the blocking stderr write happen on a background QueueListener thread
+    instead of the caller's (e.g. the event loop)
+
+    Safe to call repeatedly; re-installs the listener after a fork
+    """
+    global _configured_pid
+    logger = logging.getLogger(LOGGER_NAME)
+    with _setup_lock:
+        if _configured_pid == os.getpid():
+            return logger
+
+        log_queue = queue.SimpleQueue()
+        stream_handler = logging.StreamHandler(sys.stderr)
+        stream_handler.setFormatter(
+            logging.Formatter('%(asctime)s %(levelname)s %(name)s: %(message)s')
+        )
+        listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+        listener.start()
+        atexit.register(listener.stop)
+
+        # Drop a handler inherited across fork (its listener thread did not survive)
+        for handler in list(logger.handlers):
+            if isinstance(handler, QueueHandler):
+                logger.removeHandler(handler)
+        logger.addHandler(QueueHandler(log_queue))
+        logger.setLevel(level)
+        logger.propagate = False
+
+        _configured_pid = os.getpid()
+    return logger
+
+def get_logger(name: str) -> logging.Logger:
+    """Logger under the 'blueparser' tree, e.g. get_logger('app')"""
+    return logging.getLogger(f'{LOGGER_NAME}.{name}')
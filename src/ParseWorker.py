@@ -0,0 +1,54 @@
+from typing import Dict, Tuple
+import os
+import threading
+
+from Config import config
+from DrawingParser import DrawingParser
+from DrawingValidator import DrawingValidator
+from LogConfig import setup_logging
+
+# One parser per process, so cached OCR clients are reused across documents
+_parser = None
+
+# In the API process, OCR threads and the warmup thread may all create the parser
+_parser_lock = threading.Lock()
+
+def init_worker(warmup: bool = False):
+    """
+    Create this process's DrawingParser if there is none yet (used as the process
+    pool initializer), optionally warming it up so the first real document is not
+    slowed down
+    """
+    global _parser
+    if _parser is None:
+        with _parser_lock:
+            if _parser is None:
+                setup_logging(config.LOG_LEVEL)
+                _parser = DrawingParser()
+    if warmup:
+        DrawingValidator.validate(_parser.warmup())
+
+def ping() -> int:
+    """No-op task; submitting one per worker starts (and so warms up) the pool"""
+    return os.getpid()
+
+def extract_text(pdf_bytes: bytes, ocr_method: str, filename: str) -> Dict:
+    """
+    OCR one PDF (network-bound, so meant for a thread in the API process)
+    """
+    if _parser is None:
+        init_worker()
+
+    return _parser.extract_text(pdf_bytes, ocr_method=ocr_method, filename=filename)
+
+def analyze_document(ocr_results: Dict) -> Tuple[Dict, Dict]:
+    """
+    Classify, extract and validate OCR results (CPU-bound, so meant for a worker
+    process), returning the result and the validation as a dict
+    """
+    if _parser is None:
+        init_worker()
+
+    result = _parser.analyze(ocr_results)
+    validation = DrawingValidator.validate(result)
+    return result, validation.to_dict()
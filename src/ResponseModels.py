@@ -0,0 +1,106 @@
+from typing import Any, Dict, List, Optional, Union
+from typing_extensions import TypedDict
+
+# Response schema for /parse and /parse-batch (the LLM-friendly view of a parsed drawing).
+# TypedDicts rather than models: handlers keep building plain dicts and orjson serializes
+# them directly, while FastAPI publishes the schema in the OpenAPI docs.
+
+class DocumentSummary(TypedDict):
+    document_id: str
+    filename: str
+    drawing_type: str
+    discipline: str
+    confidence: float
+    processing_timestamp: str
+    natural_language_summary: str
+
+class DrawingInformation(TypedDict):
+    drawing_number: Optional[str]
+    title: Optional[str]
+    date: Optional[str]
+    scale: Optional[str]
+    revision: Optional[str]
+    sheet_number: Optional[str]
+
+class GeneralNote(TypedDict):
+    content: str
+    type: str
+
+class NumberedNote(GeneralNote):
+    number: str
+
+class ConstructionNotes(TypedDict):
+    numbered_notes: List[NumberedNote]
+    general_notes: List[GeneralNote]
+    count: int
+
+class Measurement(TypedDict):
+    value: Optional[str]
+    unit: Optional[str]
+    context: str
+    full_text: str
+
+class Material(TypedDict):
+    material: Optional[str]
+    specification: str
+    context: str
+
+class Standard(TypedDict):
+    standard: Optional[str]
+    context: str
+
+class Specifications(TypedDict):
+    measurements: List[Measurement]
+    materials: List[Material]
+    standards: List[Standard]
+    count: int
+
+class Reference(TypedDict):
+    type: str
+    reference: str
+    context: str
+
+class References(TypedDict):
+    items: List[Reference]
+    count: int
+
+class Table(TypedDict):
+    headers: List[Any]
+    rows: List[Any]
+    row_count: int
+    column_count: int
+
+class Tables(TypedDict):
+    items: List[Table]
+    count: int
+
+class ValidationSummary(TypedDict):
+    is_valid: bool
+    errors: List[str]
+    warnings: List[str]
+    error_count: int
+    warning_count: int
+
+class QueryTips(TypedDict):
+    description: str
+    tips: List[str]
+
+class LLMResponse(TypedDict):
+    document_summary: DocumentSummary
+    drawing_information: DrawingInformation
+    construction_notes: ConstructionNotes
+    specifications: Specifications
+    references: References
+    tables: Tables
+    specialized_content: Dict[str, Any]
+    validation: ValidationSummary
+    query_tips: QueryTips
+
+class BatchItemError(TypedDict):
+    filename: str
+    error: str
+
+class BatchResponse(TypedDict):
+    count: int
+    failed: int
+    results: List[Union[LLMResponse, BatchItemError]]
@@ -0,0 +1,149 @@
+from cachetools import TTLCache
+from typing import Any, Dict, Optional
+from LogConfig import get_logger
+
+logger = get_logger('result_store')
+
+class ResultStore:
+    """Key/value store for parsed documents, shared by all API workers"""
+
+    async def get(self, key: str) -> Optional[Any]:
+        raise NotImplementedError
+
+    async def get_json(self, key: str) -> Optional[bytes]:
+        """Stored value as JSON bytes, ready to send as a response body"""
+        raise NotImplementedError
+
+    async def set(self, key: str, value: Any):
+        raise NotImplementedError
+
+    async def delete(self, key: str):
+        raise NotImplementedError
+
+    async def expire(self):
+        """Drop entries past their TTL now rather than on the next write"""
+        pass
+
+    def stats(self) -> Dict:
+        """Counters for /metrics"""
+        raise NotImplementedError
+
+    async def close(self):
+        pass
+
+class _CountingTTLCache(TTLCache):
+    """TTLCache that counts entries dropped for age (expired) or for room (evicted)"""
+
+    def __init__(self, maxsize: int, ttl: int):
+        super().__init__(maxsize=maxsize, ttl=ttl)
+        self.expired_count = 0
+        self.evicted_count = 0
+
+    def expire(self, time=None):
+        expired = super().expire(time)
+        self.expired_count += len(expired)
+        return expired
+
+    def popitem(self):
+        item = super().popitem()
+        self.evicted_count += 1
+        return item
+
+class MemoryResultStore(ResultStore):
+    """
+    Per-process store, bounded in size and entry age
+
+    Only shared within one worker; use RedisResultStore for multi-worker deployments.
+    Accessed from the event loop only, so no locking
+    """
+
+    def __init__(self, maxsize: int, ttl: int):
+        self._cache = _CountingTTLCache(maxsize=maxsize, ttl=ttl)
+
+    async def get(self, key: str) -> Optional[Any]:
+        return self._cache.get(key)
+
+    async def get_json(self, key: str) -> Optional[bytes]:
+        value = self._cache.get(key)
+        if value is None:
+            return None
+        return _dumps(value)
+
+    async def set(self, key: str, value: Any):
+        self._cache[key] = value
+
+    async def delete(self, key: str):
+        self._cache.pop(key, None)
+
+    async def expire(self):
+        self._cache.expire()
+
+    def stats(self) -> Dict:
+        return {
+            'backend': 'memory',
+            'entries': len(self._cache),
+            'max_entries': self._cache.maxsize,
+            'ttl_seconds': self._cache.ttl,
+            'expired': self._cache.expired_count,
+            'evicted': self._cache.evicted_count
+        }
+
+class RedisResultStore(ResultStore):
+    """
+    Redis-backed store, values serialized with orjson and expired by Redis
+    """
+
+    def __init__(self, url: str, ttl: int):
+        import orjson
+        import redis.asyncio as redis
+
+        self._orjson = orjson
+        self._redis = redis.from_url(url)
+        self._ttl = ttl
+
+    async def get(self, key: str) -> Optional[Any]:
+        data = await self._redis.get(key)
+        if data is None:
+            return None
+        return self._orjson.loads(data)
+
+    async def get_json(self, key: str) -> Optional[bytes]:
+        # Already serialized on set; returned without a decode/encode round-trip
+        return await self._redis.get(key)
+
+    async def set(self, key: str, value: Any):
+        await self._redis.set(key, _dumps(value), ex=self._ttl)
+
+    async def delete(self, key: str):
+        await self._redis.delete(key)
+
+    def stats(self) -> Dict:
+        # Redis expires keys itself; its own INFO covers memory and evictions
+        return {
+            'backend': 'redis',
+            'ttl_seconds': self._ttl
+        }
+
+    async def close(self):
+        await self._redis.aclose()
+
+def _dumps(value: Any) -> bytes:
+    import orjson
+
+    return orjson.dumps(
+        value,
+        default=str,
+        option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    )
+
+def create_result_store(config) -> ResultStore:
+    """
+    Build the store selected by config: Redis when REDIS_URL is set, else in-memory
+    """
+    if config.REDIS_URL:
+        try:
+            return RedisResultStore(config.REDIS_URL, config.RESULT_TTL_SECONDS)
+        except ImportError:
+            logger.warning("redis not installed. Falling back to in-memory result store.")
+
+    return MemoryResultStore(config.RESULT_CACHE_SIZE, config.RESULT_TTL_SECONDS)
@@ -1,16 +1,141 @@
 from fastapi import FastAPI, File, UploadFile, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from cachetools import TTLCache
+from starlette.concurrency import run_in_threadpool
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
 from datetime import datetime
+from functools import lru_cache, partial
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+from urllib.parse import quote
 from Config import config
+import asyncio
+import hashlib
+import multiprocessing
+import os
+import random
+import re
+import tempfile
+import time
+
+from DataExporter import DataExporter
+from DocTypeDetection import DrawingDiscipline, DrawingType
+from LogConfig import get_logger, setup_logging
+from DrawingValidator import ValidationResult
+from ParseWorker import analyze_document, extract_text, init_worker, ping
+from ResponseModels import (
+    BatchItemError, BatchResponse, LLMResponse, Material, Measurement, Standard
+)
+from ResultStore import create_result_store
+
+setup_logging(config.LOG_LEVEL)
+logger = get_logger('app')
+
+# Starlette spools uploads over 1 MB to tempfile's directory (as does pdf2image for
+# rendered pages); pointing it at a tmpfs keeps those bytes in RAM
+if config.UPLOAD_DIR:
+    try:
+        os.makedirs(config.UPLOAD_DIR, exist_ok=True)
+        tempfile.tempdir = config.UPLOAD_DIR
+    except OSError as e:
+        logger.warning("UPLOAD_DIR %s unusable (%s), using system temp dir", config.UPLOAD_DIR, e)
+
+# Parsed documents keyed by "<sha256 of PDF bytes>:<ocr_method>", so re-uploading
+# an identical PDF skips OCR, parsing and validation
+result_store = create_result_store(config)
+
+# Parses currently running, by document id; concurrent uploads of the same PDF
+# (e.g. a client retrying, or duplicates in one batch) await the same task
+inflight_parses: Dict[str, asyncio.Future] = {}
+
+# Built Excel/JSON exports by (document_id, format). Documents are content-addressed,
+# so an export never goes stale; entries live as long as stored results
+export_cache = TTLCache(maxsize=config.EXPORT_CACHE_SIZE, ttl=config.RESULT_TTL_SECONDS)
+
+# Worker processes that analyze OCR results and validate them (None = default
+# thread pool); OCR itself waits on the network, so it runs in API-process threads
+parse_pool = None
+
+# Set once the parsers have been warmed up; /health reports 503 until then
+service_ready = False
+
+# Seconds between sweeps of expired entries from the result store
+RESULT_SWEEP_SECONDS = 60
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    global parse_pool, service_ready
+    service_ready = False
+    if config.PARSE_WORKERS > 0:
+        # Workers start from a clean process instead of forking this one, which
+        # already runs threads (log listener, event loop); init_worker rebuilds
+        # all per-process state
+        start_method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+        mp_context = multiprocessing.get_context(start_method)
+        if start_method == 'forkserver':
+            # The fork server would otherwise import __main__ too; workers only need
+            # ParseWorker, not this module's import-time setup (logging, result store)
+            mp_context.set_forkserver_preload(['ParseWorker'])
+        parse_pool = ProcessPoolExecutor(
+            max_workers=config.PARSE_WORKERS,
+            mp_context=mp_context,
+            initializer=init_worker,
+            initargs=(True,)
+        )
+    
+    # Warm up in the background so the server starts accepting requests immediately
+    warmup_task = asyncio.create_task(_warm_up())
+    sweep_task = asyncio.create_task(_sweep_result_store())
+    
+    yield
+    
+    warmup_task.cancel()
+    sweep_task.cancel()
+    if parse_pool is not None:
+        parse_pool.shutdown()
+        parse_pool = None
+    await result_store.close()
+
+
+async def _warm_up():
+    """
+    Warm the in-process parser (used for OCR) and start and warm every parse
+    worker, then mark the service ready
+    """
+    global service_ready
+    try:
+        tasks = [run_in_threadpool(init_worker, True)]
+        if parse_pool is not None:
+            # One task per worker: the pool spawns a process for each, running init_worker
+            loop = asyncio.get_running_loop()
+            tasks.extend(
+                loop.run_in_executor(parse_pool, ping) for _ in range(config.PARSE_WORKERS)
+            )
+        await asyncio.gather(*tasks)
+    except Exception:
+        logger.exception("Warmup failed")
+    service_ready = True
+
+
+async def _sweep_result_store():
+    """
+    Periodically drop expired results, so an idle server does not keep them in memory
+    """
+    while True:
+        await asyncio.sleep(RESULT_SWEEP_SECONDS)
+        await result_store.expire()
 
-from DrawingParser import DrawingParser
-from DrawingValidator import DrawingValidator
 
 app = FastAPI(
     title="BlueParser API",
     description="API for parsing and analyzing engineering drawings",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # CORS middleware
@@ -22,23 +147,84 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Initialize components
-parser = DrawingParser()
-validator = DrawingValidator()
+# Compress JSON/CSV responses over 1 KB for clients that accept gzip
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=6)
+
+# Every PDF file starts with this header
+PDF_MAGIC = b'%PDF-'
+
+# Error codes/messages that mean the OCR provider is throttling us (retryable)
+THROTTLING_ERROR_CODES = {
+    'ThrottlingException', 'ProvisionedThroughputExceededException',
+    'LimitExceededException', 'TooManyRequestsException', 'RequestLimitExceeded', 'SlowDown'
+}
+THROTTLING_MESSAGES = ('throttl', 'quota', 'rate exceeded', 'too many requests', 'resource exhausted')
+
+
+class RateLimiter:
+    """Space out acquisitions so at most `rate` start per second (0 disables)"""
+    
+    def __init__(self, rate: float):
+        self._interval = 1.0 / rate if rate > 0 else 0.0
+        self._next_slot = 0.0
+        self._lock = asyncio.Lock()
+    
+    async def wait(self):
+        if not self._interval:
+            return
+        async with self._lock:
+            now = time.monotonic()
+            delay = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self._interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+# Bound how many parses hit Textract/Vision at once, and how fast they start
+ocr_semaphore = asyncio.Semaphore(config.MAX_OCR_CONCURRENCY)
+ocr_rate_limiter = RateLimiter(config.OCR_REQUESTS_PER_SECOND)
+
+
+# Media types for /export formats
+EXPORT_MEDIA_TYPES = {
+    'csv': 'text/csv',
+    'excel': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+    'json': 'application/json'
+}
+
+# Characters replaced in the plain filename= of an export: anything outside printable
+# ASCII, and the quote and backslash, which would end or escape the quoted value
+_UNSAFE_FILENAME_RE = re.compile(r'[^\x20-\x7e]|["\\]')
+
+# Static parts of the status responses; only the timestamp changes per request
+ROOT_RESPONSE = {
+    "status": "online",
+    "service": "BlueParser API",
+    "version": "1.0.0"
+}
+HEALTH_RESPONSE = {
+    "status": "healthy",
+    "components": {
+        "parser": "ready",
+        "validator": "ready"
+    }
+}
+STARTING_RESPONSE = {
+    "status": "starting",
+    "components": {
+        "parser": "warming_up",
+        "validator": "warming_up"
+    }
+}
 
 
 @app.get("/")
 async def root():
     """API health check"""
-    return {
-        "status": "online",
-        "service": "BlueParser API",
-        "version": "1.0.0",
-        "timestamp": datetime.now().isoformat()
-    }
+    return {**ROOT_RESPONSE, "timestamp": _current_timestamp()}
 
 
-@app.post("/parse")
+@app.post("/parse", responses={200: {"model": LLMResponse}})
 async def parse_drawing(
     file: UploadFile = File(...),
     ocr_method: str = "textract"
@@ -58,25 +244,331 @@ async def parse_drawing(
         raise HTTPException(status_code=400, detail="OCR method must be 'textract' or 'vision'")
     
     try:
-        # Read file content into memory
-        file_content = await file.read()
+        llm_friendly_result = await _process_upload(file, ocr_method, datetime.now().isoformat())
+        return ORJSONResponse(content=llm_friendly_result)
         
-        # Parse the drawing using file content directly
-        result = parser.parse(file_content, ocr_method=ocr_method, filename=file.filename)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.exception("Parsing %s failed", file.filename)
+        raise HTTPException(status_code=500, detail=f"Parsing failed: {str(e)}")
+
+
+@app.post("/parse-batch", responses={200: {"model": BatchResponse}})
+async def parse_drawing_batch(
+    files: List[UploadFile] = File(...),
+    ocr_method: str = "textract"
+):
+    """
+    Parse several engineering drawing PDFs concurrently
+    
+    - **files**: PDF files to parse
+    - **ocr_method**: OCR method to use ('textract' or 'vision')
+    
+    Results are returned in upload order; a file that fails gets an error entry
+    instead of failing the whole batch
+    """
+    if ocr_method not in ['textract', 'vision']:
+        raise HTTPException(status_code=400, detail="OCR method must be 'textract' or 'vision'")
+    
+    if len(files) > config.MAX_BATCH_FILES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {config.MAX_BATCH_FILES} files can be parsed per batch"
+        )
+    
+    timestamp = datetime.now().isoformat()
+    
+    async def process(file: UploadFile) -> Union[LLMResponse, BatchItemError]:
+        if not file.filename.lower().endswith('.pdf'):
+            return {'filename': file.filename, 'error': "Only PDF files are supported"}
+        try:
+            return await _process_upload(file, ocr_method, timestamp)
+        except HTTPException as e:
+            return {'filename': file.filename, 'error': e.detail}
+        except Exception as e:
+            return {'filename': file.filename, 'error': f"Parsing failed: {str(e)}"}
+    
+    # Documents share the OCR semaphore/rate limit and the worker pool with /parse
+    results = await asyncio.gather(*(process(file) for file in files))
+    
+    return ORJSONResponse(content={
+        'count': len(results),
+        'failed': sum(1 for item in results if 'error' in item),
+        'results': results
+    })
+
+
+@app.get("/result/{document_id}")
+async def get_result(document_id: str):
+    """
+    Stored parse result, validation and filename for a document
+    
+    - **document_id**: `document_summary.document_id` from a /parse response
+    
+    Served from the store's serialized bytes without re-encoding
+    """
+    content = await result_store.get_json(document_id)
+    if content is None:
+        raise HTTPException(status_code=404, detail="Document not found or expired")
+    return Response(content=content, media_type="application/json")
+
+
+@app.get("/export/{document_id}")
+async def export_result(document_id: str, format: str = "csv"):
+    """
+    Download a parsed document as CSV, Excel or JSON
+    
+    - **document_id**: `document_summary.document_id` from a /parse response
+    - **format**: 'csv', 'excel' or 'json'
+    
+    Exports are built in memory and streamed to the client; nothing is written to disk.
+    Excel and JSON bytes are kept in export_cache, so repeat downloads skip the exporter
+    """
+    if format not in EXPORT_MEDIA_TYPES:
+        raise HTTPException(status_code=400, detail="Format must be 'csv', 'excel' or 'json'")
+    
+    cache_key = (document_id, format)
+    cached = export_cache.get(cache_key)
+    if cached is None:
+        stored = await result_store.get(document_id)
+        if stored is None:
+            raise HTTPException(status_code=404, detail="Document not found or expired")
         
-        # Validate the result
-        validation = validator.validate(result)
+        result = stored['result']
+        name = Path(stored.get('filename') or 'drawing.pdf').stem
         
-        # Transform to LLM-friendly format
-        llm_friendly_result = _transform_for_llm(result, validation, file.filename)
+        if format == 'csv':
+            return StreamingResponse(
+                DataExporter.to_csv_stream(result),
+                media_type=EXPORT_MEDIA_TYPES[format],
+                headers=_export_headers(name, format)
+            )
         
-        return JSONResponse(content=llm_friendly_result)
+        if format == 'excel':
+            content = await run_in_threadpool(DataExporter.to_excel_bytes, result)
+            if content is None:
+                raise HTTPException(status_code=501, detail="Excel export requires openpyxl")
+        else:
+            # Same bytes as DataExporter.to_json would write, without the file
+            content = await run_in_threadpool(DataExporter.to_json_bytes, result)
         
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Parsing failed: {str(e)}")
+        cached = export_cache[cache_key] = (content, name)
+    
+    content, name = cached
+    return Response(
+        content=content,
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers=_export_headers(name, format)
+    )
+
+
+def _export_headers(name: str, format: str) -> Dict[str, str]:
+    """
+    Content-Disposition for an export of the upload named name. Header values must be
+    latin-1, so filename= carries an ASCII fallback and filename* the UTF-8 name (RFC 6266)
+    """
+    extension = 'xlsx' if format == 'excel' else format
+    filename = f"{name}.{extension}"
+    fallback = _UNSAFE_FILENAME_RE.sub('_', filename)
+    encoded = quote(filename, safe='')
+    return {'Content-Disposition': f'attachment; filename="{fallback}"; filename*=UTF-8\'\'{encoded}'}
+
+
+async def _process_upload(file: UploadFile, ocr_method: str, timestamp: str) -> LLMResponse:
+    """
+    Read, parse (or fetch from the result store) and transform one uploaded PDF
+    """
+    file_content, digest = await _read_upload(file)
+    
+    document_id = f"{digest}:{ocr_method}"
+    stored = await result_store.get(document_id)
+    if stored is None:
+        task = inflight_parses.get(document_id)
+        if task is None:
+            task = asyncio.ensure_future(
+                _parse_and_store(document_id, file_content, ocr_method, file.filename)
+            )
+            inflight_parses[document_id] = task
+            task.add_done_callback(partial(_parse_done, document_id))
+        # Shielded: one waiter disconnecting must not cancel the parse for the others
+        stored = await asyncio.shield(task)
+    
+    validation = ValidationResult.from_dict(stored['validation'])
+    
+    # Transform to LLM-friendly format
+    return _transform_for_llm(stored['result'], validation, file.filename, document_id, timestamp)
+
+
+def _parse_done(document_id: str, task: asyncio.Future):
+    """
+    Forget a finished parse. Its error is logged here, as every waiter may have
+    disconnected and left it unretrieved
+    """
+    inflight_parses.pop(document_id, None)
+    if not task.cancelled() and task.exception() is not None:
+        logger.error("Parse of %s failed", document_id, exc_info=task.exception())
+
+
+async def _parse_and_store(document_id: str, file_content: bytes,
+                           ocr_method: str, filename: str) -> Dict:
+    """
+    Parse and validate in the worker pool (so concurrent uploads run in parallel)
+    and keep the outcome in the result store
+    """
+    result, validation_data = await _parse_with_backoff(file_content, ocr_method, filename)
+    stored = {
+        'result': result,
+        'validation': validation_data,
+        'filename': filename
+    }
+    await result_store.set(document_id, stored)
+    return stored
+
+
+async def _read_upload(file: UploadFile) -> Tuple[bytes, str]:
+    """
+    Read an uploaded file without blocking the event loop
+    
+    Rejects files over MAX_UPLOAD_MB (413) and files that do not start with the
+    PDF magic bytes (415) before any of it reaches OCR.
+    Returns the file content and its SHA-256 hex digest
+    """
+    max_bytes = config.MAX_UPLOAD_MB * 1024 * 1024
+    if file.size is not None and file.size > max_bytes:
+        raise HTTPException(status_code=413, detail=f"File exceeds {config.MAX_UPLOAD_MB} MB limit")
+    
+    # Read, check and hash in a single worker-thread hop
+    return await run_in_threadpool(_read_and_hash, file.file, file.size, max_bytes)
+
+
+def _read_and_hash(source, size: Optional[int], max_bytes: int) -> Tuple[bytes, str]:
+    """
+    Read the spooled upload with one read() call, so the bytes are copied once
+    into a single buffer sized up front (no chunk list or bytearray growth)
+    """
+    if size is None:
+        # Measure the spooled file instead of reading up to max_bytes + 1, which
+        # would allocate a buffer of the full upload limit for every file
+        size = min(source.seek(0, os.SEEK_END), max_bytes + 1)
+    source.seek(0)
+    content = source.read(size)
+    if len(content) == size and source.read(1):
+        # More data than the multipart size claimed
+        raise HTTPException(status_code=413, detail=f"File exceeds {config.MAX_UPLOAD_MB} MB limit")
+    
+    if len(content) > max_bytes:
+        raise HTTPException(status_code=413, detail=f"File exceeds {config.MAX_UPLOAD_MB} MB limit")
+    if not content:
+        raise HTTPException(status_code=400, detail="Uploaded file is empty")
+    if not content.startswith(PDF_MAGIC):
+        raise HTTPException(status_code=415, detail="File is not a valid PDF")
+    
+    # One-shot hash over the whole buffer: OpenSSL (SHA-NI where available) runs
+    # with the GIL released
+    return content, hashlib.sha256(content).hexdigest()
+
+
+async def _parse_with_backoff(file_content: bytes, ocr_method: str,
+                              filename: str) -> Tuple[Dict, Dict]:
+    """
+    OCR in a worker thread under the OCR concurrency/rate limits, retrying throttled
+    calls with exponential backoff (1s doubling up to 30s, with jitter), then analyze
+    and validate in parse_pool
+    """
+    delay = 1.0
+    for attempt in range(config.OCR_MAX_RETRIES + 1):
+        try:
+            async with ocr_semaphore:
+                await ocr_rate_limiter.wait()
+                ocr_results = await run_in_threadpool(
+                    extract_text, file_content, ocr_method, filename
+                )
+            break
+        except Exception as e:
+            if attempt == config.OCR_MAX_RETRIES or not _is_throttling_error(e):
+                raise
+            logger.warning("OCR throttled (%s), retrying in %.0fs (attempt %d/%d)",
+                           e, delay, attempt + 1, config.OCR_MAX_RETRIES)
+        
+        # Sleep outside the semaphore so other uploads can proceed meanwhile
+        await asyncio.sleep(delay * random.uniform(0.5, 1.0))
+        delay = min(delay * 2, 30.0)
+    
+    # The CPU-bound part runs in worker processes, outside the OCR semaphore
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(parse_pool, analyze_document, ocr_results)
 
 
-def _transform_for_llm(result: dict, validation, filename: str) -> dict:
+def _is_throttling_error(error: Exception) -> bool:
+    """
+    Classify an OCR exception as throttling by provider error code, HTTP status or message
+    """
+    # botocore ClientError
+    response = getattr(error, 'response', None)
+    if isinstance(response, dict):
+        if response.get('Error', {}).get('Code') in THROTTLING_ERROR_CODES:
+            return True
+        if response.get('ResponseMetadata', {}).get('HTTPStatusCode') == 429:
+            return True
+    
+    # google.api_core ResourceExhausted / TooManyRequests
+    if getattr(error, 'code', None) == 429:
+        return True
+    
+    message = str(error).lower()
+    return any(text in message for text in THROTTLING_MESSAGES)
+
+
+# Classification values -> display names, e.g. 'pump_station' -> 'Pump Station'
+TYPE_DISPLAY_NAMES = {t.value: t.value.replace('_', ' ').title() for t in DrawingType}
+DISCIPLINE_DISPLAY_NAMES = {d.value: d.value.title() for d in DrawingDiscipline}
+
+
+def _display_name(names: dict, value: str) -> str:
+    name = names.get(value)
+    if name is None:
+        name = value.replace('_', ' ').title()
+    return name
+
+
+def _shape_measurement(spec: dict) -> Measurement:
+    value = spec.get('value')
+    unit = spec.get('unit')
+    context = spec.get('context', '')
+    return {
+        'value': value,
+        'unit': unit,
+        'context': context,
+        'full_text': f"{value}{unit} - {context}"
+    }
+
+
+def _shape_material(spec: dict) -> Material:
+    return {
+        'material': spec.get('material'),
+        'specification': spec.get('specification', ''),
+        'context': spec.get('context', '')
+    }
+
+
+def _shape_standard(spec: dict) -> Standard:
+    return {
+        'standard': spec.get('standard'),
+        'context': spec.get('context', '')
+    }
+
+
+# Specification type -> (group in the response, shaping function)
+SPEC_HANDLERS = {
+    'measurement': ('measurements', _shape_measurement),
+    'material': ('materials', _shape_material),
+    'standard': ('standards', _shape_standard)
+}
+
+
+def _transform_for_llm(result: dict, validation, filename: str,
+                       document_id: str, timestamp: str) -> LLMResponse:
     """
     Transform parser output into an LLM-friendly format with:
     - Natural language summaries
@@ -84,13 +576,13 @@ def _transform_for_llm(result: dict, validation, filename: str) -> dict:
     - Contextual information
     - Easy-to-query format
     """
-    classification = result.get('classification', {})
-    universal_data = result.get('universal_data', {})
+    classification = result.get('classification') or {}
+    universal_data = result.get('universal_data') or {}
     specialized_data = result.get('specialized_data', {})
     
     # Build natural language summary
-    drawing_type = classification.get('type', 'unknown').replace('_', ' ').title()
-    discipline = classification.get('discipline', 'unknown').title()
+    drawing_type = _display_name(TYPE_DISPLAY_NAMES, classification.get('type', 'unknown'))
+    discipline = _display_name(DISCIPLINE_DISPLAY_NAMES, classification.get('discipline', 'unknown'))
     
     summary_parts = [
         f"This is a {drawing_type} drawing from the {discipline} discipline."
@@ -104,7 +596,7 @@ def _transform_for_llm(result: dict, validation, filename: str) -> dict:
         summary_parts.append("It has a legend or symbol key.")
     
     # Extract title block info
-    titleblock = universal_data.get('titleblock', {})
+    titleblock = universal_data.get('titleblock') or {}
     if titleblock:
         if titleblock.get('drawing_number'):
             summary_parts.append(f"Drawing number: {titleblock['drawing_number']}.")
@@ -112,26 +604,32 @@ def _transform_for_llm(result: dict, validation, filename: str) -> dict:
             summary_parts.append(f"Title: {titleblock['drawing_title']}.")
     
     # Process notes into structured format
-    notes_data = universal_data.get('notes', [])
-    structured_notes = {
-        'numbered_notes': [],
-        'general_notes': [],
-        'count': len(notes_data)
-    }
+    notes_data = universal_data.get('notes') or []
+    numbered_notes = []
+    general_notes = []
+    add_numbered = numbered_notes.append
+    add_general = general_notes.append
     
     for note in notes_data:
         note_entry = {
             'content': note.get('content', ''),
             'type': note.get('type', 'general')
         }
-        if note.get('number'):
-            note_entry['number'] = note['number']
-            structured_notes['numbered_notes'].append(note_entry)
+        number = note.get('number')
+        if number:
+            note_entry['number'] = number
+            add_numbered(note_entry)
         else:
-            structured_notes['general_notes'].append(note_entry)
+            add_general(note_entry)
+    
+    structured_notes = {
+        'numbered_notes': numbered_notes,
+        'general_notes': general_notes,
+        'count': len(notes_data)
+    }
     
     # Process specifications into grouped format
-    specs_data = universal_data.get('specification', [])
+    specs_data = universal_data.get('specification') or []
     specifications = {
         'measurements': [],
         'materials': [],
@@ -140,54 +638,42 @@ def _transform_for_llm(result: dict, validation, filename: str) -> dict:
     }
     
     for spec in specs_data:
-        if spec.get('type') == 'measurement':
-            specifications['measurements'].append({
-                'value': spec.get('value'),
-                'unit': spec.get('unit'),
-                'context': spec.get('context', ''),
-                'full_text': f"{spec.get('value')}{spec.get('unit')} - {spec.get('context', '')}"
-            })
-        elif spec.get('type') == 'material':
-            specifications['materials'].append({
-                'material': spec.get('material'),
-                'specification': spec.get('specification', ''),
-                'context': spec.get('context', '')
-            })
-        elif spec.get('type') == 'standard':
-            specifications['standards'].append({
-                'standard': spec.get('standard'),
-                'context': spec.get('context', '')
-            })
+        handler = SPEC_HANDLERS.get(spec.get('type'))
+        if handler is not None:
+            group, shape = handler
+            specifications[group].append(shape(spec))
     
     # Process references
-    references = universal_data.get('reference', [])
-    structured_references = []
-    for ref in references:
-        structured_references.append({
+    structured_references = [
+        {
             'type': ref.get('type', 'unknown'),
             'reference': ref.get('reference', ''),
             'context': ref.get('context', '')
-        })
+        }
+        for ref in universal_data.get('reference') or []
+    ]
     
     # Process tables
-    tables = universal_data.get('table', [])
     structured_tables = []
-    for table in tables:
+    for table in universal_data.get('table') or []:
+        headers = table.get('headers', [])
+        rows = table.get('rows', [])
         structured_tables.append({
-            'headers': table.get('headers', []),
-            'rows': table.get('rows', []),
-            'row_count': len(table.get('rows', [])),
-            'column_count': len(table.get('headers', []))
+            'headers': headers,
+            'rows': rows,
+            'row_count': len(rows),
+            'column_count': len(headers)
         })
     
     # Build the LLM-friendly response
     llm_response = {
         'document_summary': {
+            'document_id': document_id,
             'filename': filename,
             'drawing_type': drawing_type,
             'discipline': discipline,
             'confidence': classification.get('confidence', 0),
-            'processing_timestamp': datetime.now().isoformat(),
+            'processing_timestamp': timestamp,
             'natural_language_summary': ' '.join(summary_parts)
         },
         'drawing_information': {
@@ -235,13 +721,35 @@ def _transform_for_llm(result: dict, validation, filename: str) -> dict:
 @app.get("/health")
 async def health_check():
     """
-    Detailed health check
+    Detailed health check (503 until the parsers have been warmed up)
     """
+    if not service_ready:
+        return ORJSONResponse(
+            status_code=503,
+            content={**STARTING_RESPONSE, "timestamp": _current_timestamp()}
+        )
+    return {**HEALTH_RESPONSE, "timestamp": _current_timestamp()}
+
+
+@app.get("/metrics")
+async def metrics():
+    """Result store size and eviction counters, and parses in progress"""
     return {
-        "status": "healthy",
-        "components": {
-            "parser": "ready",
-            "validator": "ready"
-        },
-        "timestamp": datetime.now().isoformat()
+        "result_store": result_store.stats(),
+        "export_cache_entries": len(export_cache),
+        "inflight_parses": len(inflight_parses),
+        "parse_workers": config.PARSE_WORKERS if parse_pool is not None else 0
     }
+
+
+def _current_timestamp() -> str:
+    """
+    ISO timestamp with one-second resolution, formatted at most once per second
+    """
+    return _format_timestamp(int(time.time()))
+
+
+@lru_cache(maxsize=1)
+def _format_timestamp(second: int) -> str:
+    return datetime.fromtimestamp(second).isoformat()
+
@@ -1,3 +1,4 @@
+from operator import itemgetter
 from typing import List, Dict, Optional
 
 class BaseExtractor:
@@ -5,3 +6,39 @@ class BaseExtractor:
     
     def extract(self, text_items: List[Dict], zones: Dict) -> Dict:
         raise NotImplementedError
+    
+    @property
+    def result_key(self) -> str:
+        """Key of this extractor's output in DrawingParser's universal_data, e.g. 'notes'"""
+        return self.__class__.__name__.replace('Extractor', '').lower()
+    
+    def extract_once(self, text_items: List[Dict], zones: Dict,
+                     universal_data: Optional[Dict] = None):
+        """
+        extract(), unless universal_data already has this extractor's result for the
+        same text_items (extractors only read the items, not the caller's zones)
+        """
+        if universal_data:
+            result = universal_data.get(self.result_key)
+            if result is not None:
+                return result
+        return self.extract(text_items, zones)
+    
+    @staticmethod
+    def _full_text(text_items: List[Dict], zones: Dict) -> str:
+        """
+        Text of all items joined with spaces; DrawingParser and the specialized
+        parsers precompute it once as zones['_full_text'], other callers get it
+        joined here
+        """
+        full_text = zones.get('_full_text')
+        if full_text is None:
+            full_text = ' '.join(map(itemgetter('text'), text_items))
+        return full_text
+    
+    @staticmethod
+    def _full_text_upper(full_text: str, zones: Dict) -> str:
+        """full_text.upper(), reusing zones['_full_text_upper'] when it matches"""
+        if zones.get('_full_text') is full_text and '_full_text_upper' in zones:
+            return zones['_full_text_upper']
+        return full_text.upper()
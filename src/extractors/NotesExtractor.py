@@ -2,6 +2,16 @@ import re
 from typing import List, Dict
 from extractors.BaseExtractor import BaseExtractor
 
+# Numbered notes (1), (2), (3)
+_NUMBERED_NOTES_RE = re.compile(r'\((\d+)\)\s+([^\(]+?)(?=\(\d+\)|$)', re.DOTALL)
+
+# NOTE: or NOTES: blocks
+_NOTE_BLOCK_RE = re.compile(
+    r'NOTES?[:\s]+([^\n]+(?:\n(?!NOTE)[^\n]+)*)',
+    re.IGNORECASE | re.MULTILINE
+)
+
+_DISCLAIMER_RE = re.compile(r'DISCLAIMER[:\s-]+([^\n]+(?:\n[^\n]+)*)', re.IGNORECASE)
 
 class NotesExtractor(BaseExtractor):
     """Extract notes, disclaimers, and annotations"""
@@ -9,42 +19,33 @@ class NotesExtractor(BaseExtractor):
     def extract(self, text_items: List[Dict], zones: Dict) -> List[Dict]:
         notes = []
         
-        full_text = ' '.join([item['text'] for item in text_items])
+        full_text = self._full_text(text_items, zones)
+        upper = self._full_text_upper(full_text, zones)
         
-        # Pattern 1: Numbered notes (1), (2), (3)
-        numbered_notes = re.findall(
-            r'\((\d+)\)\s+([^\(]+?)(?=\(\d+\)|$)', 
-            full_text, 
-            re.DOTALL
-        )
+        # Each pattern is skipped when its literal part is absent (a plain
+        # substring search is much cheaper than a regex scan of the document)
         
-        for num, content in numbered_notes:
-            notes.append({
-                'type': 'numbered',
-                'number': num,
-                'content': content.strip()
-            })
+        # Pattern 1: Numbered notes (1), (2), (3)
+        if '(' in full_text:
+            for match in _NUMBERED_NOTES_RE.finditer(full_text):
+                num, content = match.groups()
+                notes.append({
+                    'type': 'numbered',
+                    'number': num,
+                    'content': content.strip()
+                })
         
         # Pattern 2: NOTE: or NOTES:
-        note_blocks = re.findall(
-            r'NOTES?[:\s]+([^\n]+(?:\n(?!NOTE)[^\n]+)*)',
-            full_text,
-            re.IGNORECASE | re.MULTILINE
-        )
-        
-        for note in note_blocks:
-            notes.append({
-                'type': 'general',
-                'content': note.strip()
-            })
+        if 'NOTE' in upper:
+            for match in _NOTE_BLOCK_RE.finditer(full_text):
+                notes.append({
+                    'type': 'general',
+                    'content': match.group(1).strip()
+                })
         
         # Pattern 3: Disclaimers
-        if 'DISCLAIMER' in full_text.upper():
-            disclaimer_match = re.search(
-                r'DISCLAIMER[:\s-]+([^\n]+(?:\n[^\n]+)*)',
-                full_text,
-                re.IGNORECASE
-            )
+        if 'DISCLAIMER' in upper:
+            disclaimer_match = _DISCLAIMER_RE.search(full_text)
             if disclaimer_match:
                 notes.append({
                     'type': 'disclaimer',
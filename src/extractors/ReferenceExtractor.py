@@ -2,53 +2,49 @@ import re
 from typing import List, Dict
 from extractors.BaseExtractor import BaseExtractor
 
+# "See Drawing X"
+_DRAWING_REF_RE = re.compile(r'SEE\s+(DRAWING|DWG|SHEET|DETAIL)\s+([A-Z0-9-]+)', re.IGNORECASE)
+
+# FAC Rule, Code references
+_CODE_REF_RE = re.compile(r'(F\.A\.C\.|FAC)\s+(RULE\s+)?(\d+-[\d.]+)', re.IGNORECASE)
+
+# "In accordance with"
+_ACCORDANCE_RE = re.compile(r'IN ACCORDANCE WITH\s+([^\n.]+)', re.IGNORECASE)
+
 class ReferenceExtractor(BaseExtractor):
     """Extract references to other drawings, codes, regulations"""
     
     def extract(self, text_items: List[Dict], zones: Dict) -> List[Dict]:
         references = []
         
-        full_text = ' '.join([item['text'] for item in text_items])
+        full_text = self._full_text(text_items, zones)
+        upper = self._full_text_upper(full_text, zones)
         
         # Pattern: "See Drawing X"
-        drawing_refs = re.findall(
-            r'SEE\s+(DRAWING|DWG|SHEET|DETAIL)\s+([A-Z0-9-]+)',
-            full_text,
-            re.IGNORECASE
-        )
-        
-        for ref_type, ref_id in drawing_refs:
-            references.append({
-                'type': 'drawing_reference',
-                'reference_type': ref_type,
-                'reference_id': ref_id
-            })
+        if 'SEE' in upper:
+            for match in _DRAWING_REF_RE.finditer(full_text):
+                ref_type, ref_id = match.groups()
+                references.append({
+                    'type': 'drawing_reference',
+                    'reference_type': ref_type,
+                    'reference_id': ref_id
+                })
         
         # Pattern: FAC Rule, Code references
-        code_refs = re.findall(
-            r'(F\.A\.C\.|FAC)\s+(RULE\s+)?(\d+-[\d.]+)',
-            full_text,
-            re.IGNORECASE
-        )
-        
-        for prefix, _, code_num in code_refs:
-            references.append({
-                'type': 'regulation',
-                'regulation_type': 'Florida Administrative Code',
-                'code': code_num
-            })
+        if 'FAC' in upper or 'F.A.C.' in upper:
+            for match in _CODE_REF_RE.finditer(full_text):
+                references.append({
+                    'type': 'regulation',
+                    'regulation_type': 'Florida Administrative Code',
+                    'code': match.group(3)
+                })
         
         # Pattern: "In accordance with"
-        accordance_refs = re.findall(
-            r'IN ACCORDANCE WITH\s+([^\n.]+)',
-            full_text,
-            re.IGNORECASE
-        )
-        
-        for ref in accordance_refs:
-            references.append({
-                'type': 'standard_reference',
-                'description': ref.strip()
-            })
+        if 'IN ACCORDANCE WITH' in upper:
+            for match in _ACCORDANCE_RE.finditer(full_text):
+                references.append({
+                    'type': 'standard_reference',
+                    'description': match.group(1).strip()
+                })
         
         return references
\ No newline at end of file
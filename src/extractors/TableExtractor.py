@@ -1,8 +1,37 @@
 
-from typing import Dict, List
+from bisect import bisect_left
+from typing import Dict, List, NamedTuple
+import numpy as np
 from extractors.BaseExtractor import BaseExtractor
 
 
+class TextItemsSoA(NamedTuple):
+    """
+    Text items as parallel arrays (structure of arrays): item i is texts[i]
+    at tops[i], lefts[i]. Built in one pass so clustering reads contiguous
+    coordinates instead of two dict lookups per access
+    """
+    texts: List[str]
+    tops: np.ndarray
+    lefts: np.ndarray
+    
+    @classmethod
+    def from_items(cls, text_items: List[Dict]) -> 'TextItemsSoA':
+        texts = []
+        tops = []
+        lefts = []
+        for item in text_items:
+            bbox = item['bbox']
+            texts.append(item['text'])
+            tops.append(bbox['top'])
+            lefts.append(bbox['left'])
+        return cls(
+            texts,
+            np.array(tops, dtype=np.float64),
+            np.array(lefts, dtype=np.float64)
+        )
+
+
 class TableExtractor(BaseExtractor):
     """Extract tabular data"""
     
@@ -10,16 +39,16 @@ class TableExtractor(BaseExtractor):
         """
         Extract tables using spatial clustering
         """
-        # Group items by approximate row (y-coordinate)
-        rows = self._cluster_by_rows(text_items)
+        items = TextItemsSoA.from_items(text_items)
+        
+        # Group items by approximate row (y-coordinate), each row's texts
+        # already in column (x-coordinate) order
+        rows = self._cluster_by_rows(items)
         
-        # For each row, group by columns (x-coordinate)
         tables = []
         current_table = []
         
-        for row_items in rows:
-            columns = self._cluster_by_columns(row_items)
-            
+        for columns in rows:
             # If we have consistent number of columns, it's likely a table
             if len(columns) >= 2:
                 current_table.append(columns)
@@ -34,35 +63,53 @@ class TableExtractor(BaseExtractor):
         
         return tables
     
-    def _cluster_by_rows(self, items: List[Dict], tolerance: float = 0.02) -> List[List[Dict]]:
-        """Group items that are on the same horizontal line"""
-        if not items:
+    def _cluster_by_rows(self, items: 'TextItemsSoA', tolerance: float = 0.02) -> List[List[str]]:
+        """
+        Group texts that are on the same horizontal line, each row ordered by
+        x-coordinate
+        
+        A row holds the items whose top is within tolerance of the row's first
+        (highest) item. Tops are sorted once and each row's end is found by
+        binary search, then a single stable lexsort on (row, left) orders the
+        columns of every row at once instead of sorting row by row
+        """
+        tops = items.tops
+        if not len(tops):
             return []
         
-        # Sort by y-coordinate
-        sorted_items = sorted(items, key=lambda x: x['bbox']['top'])
+        # Stable, like sorted(): items with equal tops keep their input order
+        order = np.argsort(tops, kind='stable')
+        # Plain floats: the per-row loop below is scalar work, where bisect on a
+        # list beats NumPy scalar indexing and searchsorted calls
+        sorted_tops = tops[order].tolist()
         
-        rows = []
-        current_row = [sorted_items[0]]
-        current_y = sorted_items[0]['bbox']['top']
+        ends = []
+        start = 0
+        n = len(sorted_tops)
+        while start < n:
+            anchor = sorted_tops[start]
+            end = bisect_left(sorted_tops, anchor + tolerance, start)
+            # Settle rounding in anchor + tolerance against the exact row test
+            while end < n and sorted_tops[end] - anchor < tolerance:
+                end += 1
+            while end > start + 1 and not sorted_tops[end - 1] - anchor < tolerance:
+                end -= 1
+            ends.append(max(end, start + 1))
+            start = ends[-1]
         
-        for item in sorted_items[1:]:
-            if abs(item['bbox']['top'] - current_y) < tolerance:
-                current_row.append(item)
-            else:
-                rows.append(current_row)
-                current_row = [item]
-                current_y = item['bbox']['top']
+        # Row number of each item in top order; lexsort keys are minor-first and
+        # ties keep top order, as the former per-row sorted() did
+        row_ids = np.repeat(np.arange(len(ends)), np.diff(ends, prepend=0))
+        order = order[np.lexsort((items.lefts[order], row_ids))].tolist()
         
-        rows.append(current_row)
+        texts = items.texts
+        rows = []
+        start = 0
+        for end in ends:
+            rows.append([texts[i] for i in order[start:end]])
+            start = end
         return rows
     
-    def _cluster_by_columns(self, items: List[Dict]) -> List[str]:
-        """Group items into columns based on x-coordinate"""
-        # Sort by x-coordinate
-        sorted_items = sorted(items, key=lambda x: x['bbox']['left'])
-        return [item['text'] for item in sorted_items]
-    
     def _format_table(self, table_data: List[List[str]]) -> Dict:
         """Convert clustered data into structured table"""
         if not table_data:
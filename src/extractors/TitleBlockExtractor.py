@@ -1,7 +1,49 @@
 from extractors.BaseExtractor import BaseExtractor
+from operator import itemgetter
 from typing import List, Dict, Optional
 import re
 
+# Alternatives for each field, compiled once and tried in order (first match wins)
+_DRAWING_NUMBER_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'DWG[.\s#-]*([A-Z0-9-]+)',
+    r'DRAWING[.\s#-]*([A-Z0-9-]+)',
+    r'NO\.[.\s]*([A-Z0-9-]+)',
+    r'([A-Z]-\d+)',  # C-16, M-1, etc.
+    r'SHEET[.\s#-]*([A-Z0-9-]+)'
+))
+
+# Common title patterns
+_TITLE_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE | re.MULTILINE) for pattern in (
+    r'TITLE[:\s]+([^\n]+)',
+    r'^([A-Z\s]+DETAIL[S]?)',
+    r'^([A-Z\s]+PLAN)',
+    r'^([A-Z\s]+DIAGRAM)'
+))
+
+_DATE_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
+    r'(\d{4}[/-]\d{1,2}[/-]\d{1,2})',
+    r'DATE[:\s]+([^\n]+)'
+))
+
+_SCALE_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'SCALE[:\s]+([^\n,]+)',
+    r'(\d+:\d+)',
+    r'(NTS|N\.T\.S\.)',  # Not to scale
+    r'(1/\d+"?\s*=\s*\d+\'?-?\d*"?)'
+))
+
+_REVISION_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'REV[.:\s]+([A-Z0-9]+)',
+    r'REVISION[:\s]+([A-Z0-9]+)',
+    r'\bREV\s+([A-Z0-9])\b'
+))
+
+_SHEET_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'SHEET[:\s]+(\d+)\s+OF\s+(\d+)',
+    r'(\d+)\s+OF\s+(\d+)'
+))
+
 class TitleBlockExtractor(BaseExtractor):
     """Extract standard title block information"""
     
@@ -12,7 +54,7 @@ class TitleBlockExtractor(BaseExtractor):
             if item['bbox']['top'] > 0.85  # Bottom 15%
         ]
         
-        full_text = ' '.join([item['text'] for item in bottom_items])
+        full_text = ' '.join(map(itemgetter('text'), bottom_items))
         
         return {
             'drawing_number': self._extract_drawing_number(full_text),
@@ -24,31 +66,15 @@ class TitleBlockExtractor(BaseExtractor):
         }
     
     def _extract_drawing_number(self, text: str) -> Optional[str]:
-        patterns = [
-            r'DWG[.\s#-]*([A-Z0-9-]+)',
-            r'DRAWING[.\s#-]*([A-Z0-9-]+)',
-            r'NO\.[.\s]*([A-Z0-9-]+)',
-            r'([A-Z]-\d+)',  # C-16, M-1, etc.
-            r'SHEET[.\s#-]*([A-Z0-9-]+)'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _DRAWING_NUMBER_PATTERNS:
+            match = pattern.search(text)
             if match:
                 return match.group(1)
         return None
     
     def _extract_title(self, text: str) -> Optional[str]:
-        # Look for common title patterns
-        patterns = [
-            r'TITLE[:\s]+([^\n]+)',
-            r'^([A-Z\s]+DETAIL[S]?)',
-            r'^([A-Z\s]+PLAN)',
-            r'^([A-Z\s]+DIAGRAM)'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE | re.MULTILINE)
+        for pattern in _TITLE_PATTERNS:
+            match = pattern.search(text)
             if match:
                 return match.group(1).strip()
         
@@ -58,53 +84,29 @@ class TitleBlockExtractor(BaseExtractor):
         return caps_lines[0] if caps_lines else None
     
     def _extract_date(self, text: str) -> Optional[str]:
-        patterns = [
-            r'(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
-            r'(\d{4}[/-]\d{1,2}[/-]\d{1,2})',
-            r'DATE[:\s]+([^\n]+)'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _DATE_PATTERNS:
+            match = pattern.search(text)
             if match:
                 return match.group(1).strip()
         return None
     
     def _extract_scale(self, text: str) -> Optional[str]:
-        patterns = [
-            r'SCALE[:\s]+([^\n,]+)',
-            r'(\d+:\d+)',
-            r'(NTS|N\.T\.S\.)',  # Not to scale
-            r'(1/\d+"?\s*=\s*\d+\'?-?\d*"?)'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _SCALE_PATTERNS:
+            match = pattern.search(text)
             if match:
                 return match.group(1).strip()
         return None
     
     def _extract_revision(self, text: str) -> Optional[str]:
-        patterns = [
-            r'REV[.:\s]+([A-Z0-9]+)',
-            r'REVISION[:\s]+([A-Z0-9]+)',
-            r'\bREV\s+([A-Z0-9])\b'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _REVISION_PATTERNS:
+            match = pattern.search(text)
             if match:
                 return match.group(1)
         return None
     
     def _extract_sheet(self, text: str) -> Optional[str]:
-        patterns = [
-            r'SHEET[:\s]+(\d+)\s+OF\s+(\d+)',
-            r'(\d+)\s+OF\s+(\d+)'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _SHEET_PATTERNS:
+            match = pattern.search(text)
             if match:
                 return f"{match.group(1)} of {match.group(2)}"
         return None
\ No newline at end of file
@@ -0,0 +1,20 @@
+import uvicorn
+
+from Config import config
+
+# Launches the API (python main.py). Kept apart from app.py, whose import sets up
+# logging and the result store: parse workers (forkserver/spawn) and uvicorn's worker
+# processes re-import the __main__ module, which stays cheap this way
+
+if __name__ == "__main__":
+    # loop/http "auto" pick uvloop and httptools when installed (both are in
+    # requirements.txt). Workers are separate processes, so the app is passed by
+    # import string and each worker builds its own parse pool
+    uvicorn.run(
+        "app:app",
+        host=config.HOST,
+        port=config.PORT,
+        workers=config.WEB_WORKERS,
+        loop="auto",
+        http="auto"
+    )
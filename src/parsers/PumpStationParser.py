@@ -1,10 +1,329 @@
 import re
-from typing import List, Dict
+from operator import itemgetter
+from typing import List, Dict, Optional
+from extractors.BaseExtractor import BaseExtractor
 from extractors.TitleBlockExtractor import TitleBlockExtractor
 from extractors.NotesExtractor import NotesExtractor
 from extractors.SpecificationExtractor import SpecificationExtractor
 from extractors.ReferenceExtractor import ReferenceExtractor
 
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Patterns are compiled once at import. Field pattern lists are tried in order and
+# the first match wins
+
+# Numbered KEY entries, e.g. '1. 4" DI PLUG VALVE'. Zoning checks the first
+# character before matching, as most items do not start with a digit
+_KEY_ITEM_RE = re.compile(r'^\d+\.\s+')
+_COMPONENT_ITEM_RE = re.compile(r'^(\d+)\.\s+(.+)')
+
+# Fixed component size: 4", 1/2", 6', etc.
+_SIZE_RE = re.compile(r'(\d+\.?\d*(?:/\d+)?)["\']')
+
+_QUANTITY_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'\((\d+)\s*REQ\.?\)',
+    r'\((\d+)\s*REQUIRED\)',
+    r'(\d+)\s*REQ\.?',
+    r'QTY[:\s]+(\d+)'
+))
+
+# A manufacturer is only looked for when the description mentions one
+_MANUFACTURER_HINT_RE = re.compile(r'HYDROMATIC|MANUFACTURER|MFR', re.IGNORECASE)
+_MANUFACTURER_RE = re.compile(r'([A-Z][A-Z\s]+)(?:OR|,|\()')
+
+_HP_RE = re.compile(r'(\d+\.?\d*)\s*HP', re.IGNORECASE)
+
+# Zone keywords, matched as substrings of the upper-cased item text
+_PUMP_DATA_KEYWORD_RE = re.compile(
+    r'PUMP|GPM|HP|TDH|VOLTS|AMPS|RPM|MODEL|SERIAL|DESIGN|STATIC HEAD'
+)
+_ELEVATION_KEYWORD_RE = re.compile(r'ALARM|LAG|LEAD|OVERRIDE|BOTTOM|TOP|INVERT|LWL')
+
+# Component materials and types by abbreviation/keyword, in reporting order
+_MATERIAL_NAMES = {
+    'FG': 'Flanged',
+    'DI': 'Ductile Iron',
+    'SS': 'Stainless Steel',
+    '316L SS': '316L Stainless Steel',
+    '316 SS': '316 Stainless Steel',
+    'PVC': 'PVC',
+    'HDPE': 'HDPE',
+    'PE': 'Polyethylene',
+    'PVCC': 'PVCC',
+    'MJ': 'Mechanical Joint',
+    'BRASS': 'Brass',
+    'ALUMINUM': 'Aluminum',
+    'GALV': 'Galvanized'
+}
+
+_COMPONENT_TYPES = {
+    'PUMP': 'Pump',
+    'VALVE': 'Valve',
+    'GATE VALVE': 'Gate Valve',
+    'BALL VALVE': 'Ball Valve',
+    'CHECK VALVE': 'Check Valve',
+    'PLUG VALVE': 'Plug Valve',
+    'BEND': 'Bend/Elbow',
+    'ELBOW': 'Elbow',
+    'TEE': 'Tee',
+    'REDUCER': 'Reducer',
+    'FLANGE': 'Flange',
+    'NIPPLE': 'Nipple',
+    'COUPLING': 'Coupling',
+    'BUSHING': 'Bushing',
+    'PIPE': 'Pipe',
+    'GAUGE': 'Gauge',
+    'TRANSMITTER': 'Transmitter',
+    'TRANSDUCER': 'Transducer',
+    'FLOAT SWITCH': 'Float Switch',
+    'HATCH': 'Hatch',
+    'SUPPORT': 'Support',
+    'BOLT': 'Bolt',
+    'CABLE': 'Cable',
+    'RAIL': 'Rail'
+}
+
+def _build_keyword_automaton(keywords):
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+_MATERIAL_AUTOMATON = _build_keyword_automaton(_MATERIAL_NAMES)
+_COMPONENT_TYPE_AUTOMATON = _build_keyword_automaton(_COMPONENT_TYPES)
+
+def _longest_keywords(text: str, keywords, automaton) -> set:
+    """
+    Keywords found in text, leaving out mentions that are only part of a longer
+    keyword's match ('SS' in '316 SS', 'VALVE' in 'GATE VALVE'). Uses one
+    Aho-Corasick pass when pyahocorasick is installed, otherwise str.find
+    """
+    spans = []
+    if automaton is not None:
+        for end, keyword in automaton.iter(text):
+            spans.append((end + 1 - len(keyword), end + 1, keyword))
+    else:
+        for keyword in keywords:
+            start = text.find(keyword)
+            while start != -1:
+                spans.append((start, start + len(keyword), keyword))
+                start = text.find(keyword, start + 1)
+    
+    # By start, longest first: a span is inside a longer one iff an earlier span
+    # reaches at least as far
+    spans.sort(key=lambda span: (span[0], -span[1]))
+    found = set()
+    reach = -1
+    for start, end, keyword in spans:
+        if end > reach:
+            found.add(keyword)
+            reach = end
+    return found
+
+# On normalized text both backends capture the same, except that Python's
+# case-insensitive [A-Z] and I also match the Turkish dotted and dotless I
+def _compile_field_pattern(pattern: str, use_re2: bool = re2 is not None):
+    """
+    Compile one field pattern (case-insensitive, multiline). Uses RE2 when
+    google-re2 is installed: these run over the whole drawing's text when the
+    data box is not found, where RE2's linear-time scan is several times faster
+    """
+    if use_re2:
+        return re2.compile('(?im)' + pattern)
+    return re.compile(pattern, re.IGNORECASE | re.MULTILINE)
+
+def _compile(*patterns: str) -> tuple:
+    """Compile a field's alternative patterns"""
+    return tuple(_compile_field_pattern(pattern) for pattern in patterns)
+
+# Whitespace other than ' ', \t, \n, \r and \f (no-break and thin spaces, \v, ...)
+# and non-ASCII digits (full-width, Arabic-Indic, ...). OCR emits them; Python's \s
+# and \d match them but RE2's ASCII classes do not, so field text maps them to ' '
+# and ASCII digits before matching
+_FIELD_TEXT_UNSAFE_RE = re.compile(r'[^\S \t\n\r\f]|(?![0-9])\d')
+# The only ASCII characters among them, checked first so ASCII text skips the regex
+_ASCII_UNSAFE_CHARS = '\v\x1c\x1d\x1e\x1f'
+
+def _normalize_field_text(text: str) -> str:
+    """Text with _FIELD_TEXT_UNSAFE_RE characters mapped to ' ' and ASCII digits"""
+    if text.isascii() and not any(char in text for char in _ASCII_UNSAFE_CHARS):
+        return text
+    return _FIELD_TEXT_UNSAFE_RE.sub(
+        lambda match: ' ' if match.group().isspace() else str(int(match.group())),
+        text
+    )
+
+# PUMP STATION DATA box fields
+_PUMP_DATA_PATTERNS = {
+    'model': _compile(
+        r'PUMP MODEL[:\s]+([A-Z0-9\s-]+?)(?:\n|$)',
+        r'MODEL[:\s]+([A-Z0-9\s-]+?)(?:\n|$)'
+    ),
+    'serial_number': _compile(
+        r'PUMP SERIAL NO[.:\s]+([A-Z0-9-]+)',
+        r'SERIAL NO[.:\s]+([A-Z0-9-]+)'
+    ),
+    'design_capacity_gpm': _compile(
+        r'DESIGN CAPACITY[:\s]+(\d+)\s*GPM',
+        r'PUMP DESIGN POINT[:\s]+(\d+)\s*GPM',
+        r'(\d+)\s*GPM\s*@'
+    ),
+    'design_tdh': _compile(
+        r'(\d+)\s*TDH',
+        r'@\s*(\d+)\s*TDH',
+        r'GPM\s*@\s*(\d+)'
+    ),
+    'horsepower': _compile(
+        r'PUMP H\.?P\.?[:\s]+(\d+\.?\d*)',
+        r'(\d+\.?\d*)\s*HP',
+        r'(\d+\.?\d*)\s*PHASE'  # Sometimes HP is before PHASE
+    ),
+    'phase': _compile(
+        r'(\d+)\s*PHASE',
+        r'PHASE[:\s]+(\d+)'
+    ),
+    'impeller_number': _compile(
+        r'PUMP IMP\.? NO[.:\s/]+([A-Z0-9-]+)',
+        r'IMP\.?\s*NO[.:\s]+([A-Z0-9-]+)'
+    ),
+    'impeller_diameter': _compile(
+        r'IMP\.?[:\s/]+([0-9.]+)\s*(?:DIA|")',
+        r'DIA[.:\s]+([0-9.]+)'
+    ),
+    'voltage': _compile(
+        r'PUMP VOLTS[:\s]+(\d+)',
+        r'(\d+)\s*VOLTS',
+        r'(\d+)V'
+    ),
+    'amperage': _compile(
+        r'(\d+\.?\d*)\s*AMPS',
+        r'AMPS[:\s]+(\d+\.?\d*)'
+    ),
+    'shut_off_head': _compile(
+        r'SHUT[- ]OFF HEAD[:\s]+(\d+)',
+        r'SHUT[- ]OFF[:\s]+(\d+)\s*FT'
+    ),
+    'speed_rpm': _compile(
+        r'PUMP SPEED[:\s]+(\d+)\s*RPM',
+        r'(\d+)\s*RPM'
+    ),
+    'static_head': _compile(
+        r'STATIC HEAD[:\s]+(\d+)',
+        r'STATIC[:\s]+(\d+)\s*FT'
+    ),
+    'wetwell_volume_gallons': _compile(
+        r'WET WELL VOLUME[:\s]+(\d+)\s*GALLONS',
+        r'VOLUME[:\s]+(\d+)\s*GAL'
+    ),
+    'wetwell_diameter': _compile(
+        r'(\d+)\s*FT\.?\s*DIA',
+        r'(\d+)[\'"]?\s*DIA\.?\s*WETWELL',
+        r'DIA\.?\s*WETWELL[:\s]+(\d+)'
+    )
+}
+
+# Literals at least one of which any match of the field's patterns contains
+# (upper case). A field whose literals are all missing is skipped without searching
+_PUMP_DATA_LITERALS = {
+    'model': ('MODEL',),
+    'serial_number': ('SERIAL NO',),
+    'design_capacity_gpm': ('GPM',),
+    'design_tdh': ('TDH', 'GPM'),
+    'horsepower': ('PUMP H', 'HP', 'PHASE'),
+    'phase': ('PHASE',),
+    'impeller_number': ('IMP',),
+    'impeller_diameter': ('IMP', 'DIA'),
+    'voltage': ('VOLTS',) + tuple(f'{digit}V' for digit in '0123456789'),  # '(\d+)V'
+    'amperage': ('AMPS',),
+    'shut_off_head': ('SHUT',),
+    'speed_rpm': ('RPM',),
+    'static_head': ('STATIC',),
+    'wetwell_volume_gallons': ('VOLUME',),
+    'wetwell_diameter': ('DIA',)
+}
+
+# Control elevations ('__' marks a value still to be determined)
+_ELEVATION_PATTERNS = {
+    'top_el': _compile(
+        r'TOP EL\.?[:\s]+([\d.]+)',
+        r'TOP ELEVATION[:\s]+([\d.]+)'
+    ),
+    'high_high_alarm_el': _compile(
+        r'HI[/\s]*HI ALARM EL\.?[:\s]+([\d.]+|__)',
+        r'HIGH[/\s]*HIGH ALARM EL\.?[:\s]+([\d.]+|__)',
+        r'H[/]?H ALARM[:\s]+([\d.]+|__)'
+    ),
+    'high_alarm_el': _compile(
+        r'HIGH ALARM EL\.?[:\s]+([\d.]+|__)',
+        r'HIGH ALARM[:\s]+([\d.]+|__)',
+        r'HI ALARM[:\s]+([\d.]+|__)'
+    ),
+    'override_on_el': _compile(
+        r'OVERRIDE ON EL\.?[:\s]+([\d.]+|__)',
+        r'OVERRIDE ON[:\s]+([\d.]+|__)'
+    ),
+    'lag_on_el': _compile(
+        r'LAG ON EL\.?[:\s]+([\d.]+|__)',
+        r'LAG ON[:\s]+([\d.]+|__)'
+    ),
+    'lead_on_el': _compile(
+        r'LEAD ON EL\.?[:\s]+([\d.]+|__)',
+        r'LEAD ON[:\s]+([\d.]+|__)'
+    ),
+    'override_off_el': _compile(
+        r'OVERRIDE OFF EL\.?[:\s]+([\d.]+|__)',
+        r'OVERRIDE OFF[:\s]+([\d.]+|__)'
+    ),
+    'all_pumps_off_el': _compile(
+        r'ALL PUMPS OFF EL\.?[:\s]+([\d.]+|__)',
+        r'PUMPS OFF EL\.?[:\s]+([\d.]+|__)',
+        r'PUMPS OFF[:\s]+([\d.]+|__)'
+    ),
+    'bottom_el': _compile(
+        r'BOTTOM EL\.?[:\s]+([\d.]+|__)',
+        r'BOTTOM ELEVATION[:\s]+([\d.]+|__)'
+    ),
+    'invert_el': _compile(
+        r'INVERT EL\.?[:\s]+([\d.]+|__)',
+        r'INV EL\.?[:\s]+([\d.]+|__)',
+        r'INVERT ELEVATION[:\s]+([\d.]+|__)'
+    ),
+    'drop_invert_el': _compile(
+        r'DROP INVERT EL\.?[:\s]+([\d.]+|__)',
+        r'DROP INV EL\.?[:\s]+([\d.]+|__)'
+    ),
+    'low_water_level': _compile(
+        r'LWL[:\s]+([\d.]+)',
+        r'LOW WATER LEVEL[:\s]+([\d.]+)'
+    )
+}
+
+_ELEVATION_LITERALS = {
+    'top_el': ('TOP EL',),
+    'high_high_alarm_el': ('ALARM',),
+    'high_alarm_el': ('ALARM',),
+    'override_on_el': ('OVERRIDE ON',),
+    'lag_on_el': ('LAG ON',),
+    'lead_on_el': ('LEAD ON',),
+    'override_off_el': ('OVERRIDE OFF',),
+    'all_pumps_off_el': ('PUMPS OFF',),
+    'bottom_el': ('BOTTOM EL',),
+    'invert_el': ('INV',),
+    'drop_invert_el': ('DROP INV',),
+    'low_water_level': ('LWL', 'LOW WATER LEVEL')
+}
+
 class PumpStationParser:
     """Parser for pump station drawings"""
     
@@ -14,18 +333,27 @@ class PumpStationParser:
         self.spec_extractor = SpecificationExtractor()
         self.ref_extractor = ReferenceExtractor()
     
-    def parse(self, text_items: List[Dict]) -> Dict:
+    def parse(self, text_items: List[Dict], universal_data: Optional[Dict] = None,
+              full_text: Optional[str] = None) -> Dict:
+        """
+        Parse pump station drawing; universal_data (DrawingParser's universal
+        extractor results) saves re-running the shared extractors, full_text
+        (all item texts joined with spaces) saves joining them again
+        """
         zones = self._identify_zones(text_items)
+        if full_text is None:
+            full_text = ' '.join(map(itemgetter('text'), text_items))
+        zones['_full_text'] = full_text
         
         return {
             'document_type': 'pump_station',
-            'title_block': self.title_extractor.extract(text_items, zones),
+            'title_block': self.title_extractor.extract_once(text_items, zones, universal_data),
             'pump_data': self._extract_pump_data(text_items, zones),
             'components': self._extract_components(text_items, zones),
             'elevations': self._extract_elevations(text_items, zones),
-            'notes': self.notes_extractor.extract(text_items, zones),
-            'specifications': self.spec_extractor.extract(text_items, zones),
-            'references': self.ref_extractor.extract(text_items, zones)
+            'notes': self.notes_extractor.extract_once(text_items, zones, universal_data),
+            'specifications': self.spec_extractor.extract_once(text_items, zones, universal_data),
+            'references': self.ref_extractor.extract_once(text_items, zones, universal_data)
         }
     
     def _identify_zones(self, text_items: List[Dict]) -> Dict:
@@ -48,26 +376,23 @@ class PumpStationParser:
         
         for item in text_items:
             text = item['text'].strip()
+            text_upper = text.upper()
             bbox = item['bbox']
             
             # KEY section - typically top-left, numbered items
-            if re.match(r'^\d+\.\s+', text) or text == 'KEY:':
+            if (text[:1].isdigit() and _KEY_ITEM_RE.match(text)) or text == 'KEY:':
                 zones['key_section'].append(item)
             
             # PUMP STATION DATA - typically right side
             elif bbox['left'] > max_x * 0.65:  # Right 35%
-                if any(keyword in text.upper() for keyword in 
-                      ['PUMP', 'GPM', 'HP', 'TDH', 'VOLTS', 'AMPS', 'RPM', 
-                       'MODEL', 'SERIAL', 'DESIGN', 'STATIC HEAD']):
+                if _PUMP_DATA_KEYWORD_RE.search(text_upper):
                     zones['pump_data_box'].append(item)
                 else:
                     zones['general'].append(item)
             
-            # Elevation labels
-            elif 'EL' in text.upper() or 'ELEVATION' in text.upper():
-                if any(keyword in text.upper() for keyword in 
-                      ['ALARM', 'LAG', 'LEAD', 'OVERRIDE', 'BOTTOM', 
-                       'TOP', 'INVERT', 'LWL']):
+            # Elevation labels ('ELEVATION' contains 'EL')
+            elif 'EL' in text_upper:
+                if _ELEVATION_KEYWORD_RE.search(text_upper):
                     zones['elevation_labels'].append(item)
                 else:
                     zones['general'].append(item)
@@ -81,6 +406,17 @@ class PumpStationParser:
         
         return zones
     
+    def _field_text(self, text_items: List[Dict], zones: Dict) -> str:
+        """
+        All text, normalized for field matching; kept in zones so pump data and
+        elevations share one pass
+        """
+        field_text = zones.get('_field_text')
+        if field_text is None:
+            field_text = _normalize_field_text(BaseExtractor._full_text(text_items, zones))
+            zones['_field_text'] = field_text
+        return field_text
+    
     def _extract_pump_data(self, text_items: List[Dict], zones: Dict) -> Dict:
         """
         Extract pump specifications from PUMP STATION DATA box
@@ -105,85 +441,21 @@ class PumpStationParser:
         
         # Combine text from pump data zone
         pump_text_items = zones.get('pump_data_box', [])
-        if not pump_text_items:
+        if pump_text_items:
+            full_text = _normalize_field_text(' '.join(map(itemgetter('text'), pump_text_items)))
+        else:
             # Fallback: search all text
-            pump_text_items = text_items
+            full_text = self._field_text(text_items, zones)
         
-        full_text = ' '.join([item['text'] for item in pump_text_items])
         
-        # Pattern matching for each field
-        patterns = {
-            'model': [
-                r'PUMP MODEL[:\s]+([A-Z0-9\s-]+?)(?:\n|$)',
-                r'MODEL[:\s]+([A-Z0-9\s-]+?)(?:\n|$)'
-            ],
-            'serial_number': [
-                r'PUMP SERIAL NO[.:\s]+([A-Z0-9-]+)',
-                r'SERIAL NO[.:\s]+([A-Z0-9-]+)'
-            ],
-            'design_capacity_gpm': [
-                r'DESIGN CAPACITY[:\s]+(\d+)\s*GPM',
-                r'PUMP DESIGN POINT[:\s]+(\d+)\s*GPM',
-                r'(\d+)\s*GPM\s*@'
-            ],
-            'design_tdh': [
-                r'(\d+)\s*TDH',
-                r'@\s*(\d+)\s*TDH',
-                r'GPM\s*@\s*(\d+)'
-            ],
-            'horsepower': [
-                r'PUMP H\.?P\.?[:\s]+(\d+\.?\d*)',
-                r'(\d+\.?\d*)\s*HP',
-                r'(\d+\.?\d*)\s*PHASE'  # Sometimes HP is before PHASE
-            ],
-            'phase': [
-                r'(\d+)\s*PHASE',
-                r'PHASE[:\s]+(\d+)'
-            ],
-            'impeller_number': [
-                r'PUMP IMP\.? NO[.:\s/]+([A-Z0-9-]+)',
-                r'IMP\.?\s*NO[.:\s]+([A-Z0-9-]+)'
-            ],
-            'impeller_diameter': [
-                r'IMP\.?[:\s/]+([0-9.]+)\s*(?:DIA|")',
-                r'DIA[.:\s]+([0-9.]+)'
-            ],
-            'voltage': [
-                r'PUMP VOLTS[:\s]+(\d+)',
-                r'(\d+)\s*VOLTS',
-                r'(\d+)V'
-            ],
-            'amperage': [
-                r'(\d+\.?\d*)\s*AMPS',
-                r'AMPS[:\s]+(\d+\.?\d*)'
-            ],
-            'shut_off_head': [
-                r'SHUT[- ]OFF HEAD[:\s]+(\d+)',
-                r'SHUT[- ]OFF[:\s]+(\d+)\s*FT'
-            ],
-            'speed_rpm': [
-                r'PUMP SPEED[:\s]+(\d+)\s*RPM',
-                r'(\d+)\s*RPM'
-            ],
-            'static_head': [
-                r'STATIC HEAD[:\s]+(\d+)',
-                r'STATIC[:\s]+(\d+)\s*FT'
-            ],
-            'wetwell_volume_gallons': [
-                r'WET WELL VOLUME[:\s]+(\d+)\s*GALLONS',
-                r'VOLUME[:\s]+(\d+)\s*GAL'
-            ],
-            'wetwell_diameter': [
-                r'(\d+)\s*FT\.?\s*DIA',
-                r'(\d+)[\'"]?\s*DIA\.?\s*WETWELL',
-                r'DIA\.?\s*WETWELL[:\s]+(\d+)'
-            ]
-        }
+        text_upper = full_text.upper()
         
-        # Extract each field
-        for field, pattern_list in patterns.items():
+        # Pattern matching for each field
+        for field, pattern_list in _PUMP_DATA_PATTERNS.items():
+            if not any(literal in text_upper for literal in _PUMP_DATA_LITERALS[field]):
+                continue
             for pattern in pattern_list:
-                match = re.search(pattern, full_text, re.IGNORECASE | re.MULTILINE)
+                match = pattern.search(full_text)
                 if match:
                     value = match.group(1).strip()
                     # Clean up extracted value
@@ -196,7 +468,7 @@ class PumpStationParser:
             # Check if we accidentally captured phase number as HP
             if pump_data['horsepower'] == pump_data['phase']:
                 # Try to find HP separately
-                hp_match = re.search(r'(\d+\.?\d*)\s*HP', full_text, re.IGNORECASE)
+                hp_match = _HP_RE.search(full_text)
                 if hp_match:
                     pump_data['horsepower'] = hp_match.group(1)
         
@@ -223,7 +495,7 @@ class PumpStationParser:
             current_y = item['bbox']['top']
             
             # Check if this is a new numbered item
-            item_match = re.match(r'^(\d+)\.\s+(.+)', text)
+            item_match = _COMPONENT_ITEM_RE.match(text)
             
             if item_match:
                 # Save previous component if exists
@@ -281,77 +553,28 @@ class PumpStationParser:
             component['size'] = 'Variable'
         else:
             # Fixed size: 4", 1/2", 6", etc.
-            size_match = re.search(r'(\d+\.?\d*(?:/\d+)?)["\']', description)
+            size_match = _SIZE_RE.search(description)
             if size_match:
                 component['size'] = size_match.group(1) + '"'
         
-        # Extract material abbreviations
-        materials = []
-        material_map = {
-            'FG': 'Flanged',
-            'DI': 'Ductile Iron',
-            'SS': 'Stainless Steel',
-            '316L SS': '316L Stainless Steel',
-            '316 SS': '316 Stainless Steel',
-            'PVC': 'PVC',
-            'HDPE': 'HDPE',
-            'PE': 'Polyethylene',
-            'PVCC': 'PVCC',
-            'MJ': 'Mechanical Joint',
-            'BRASS': 'Brass',
-            'ALUMINUM': 'Aluminum',
-            'GALV': 'Galvanized'
-        }
-        
-        for abbr, full_name in material_map.items():
-            if abbr in description.upper():
-                materials.append(full_name)
+        description_upper = description.upper()
         
-        component['material'] = ', '.join(materials) if materials else None
+        # Extract material abbreviations and component type (first keyword in
+        # _COMPONENT_TYPES order)
+        materials = _longest_keywords(description_upper, _MATERIAL_NAMES, _MATERIAL_AUTOMATON)
+        component['material'] = ', '.join(
+            full_name for abbr, full_name in _MATERIAL_NAMES.items() if abbr in materials
+        ) or None
         
-        # Extract component type
-        type_keywords = {
-            'PUMP': 'Pump',
-            'VALVE': 'Valve',
-            'GATE VALVE': 'Gate Valve',
-            'BALL VALVE': 'Ball Valve',
-            'CHECK VALVE': 'Check Valve',
-            'PLUG VALVE': 'Plug Valve',
-            'BEND': 'Bend/Elbow',
-            'ELBOW': 'Elbow',
-            'TEE': 'Tee',
-            'REDUCER': 'Reducer',
-            'FLANGE': 'Flange',
-            'NIPPLE': 'Nipple',
-            'COUPLING': 'Coupling',
-            'BUSHING': 'Bushing',
-            'PIPE': 'Pipe',
-            'GAUGE': 'Gauge',
-            'TRANSMITTER': 'Transmitter',
-            'TRANSDUCER': 'Transducer',
-            'FLOAT SWITCH': 'Float Switch',
-            'HATCH': 'Hatch',
-            'SUPPORT': 'Support',
-            'BOLT': 'Bolt',
-            'CABLE': 'Cable',
-            'RAIL': 'Rail'
-        }
-        
-        for keyword, type_name in type_keywords.items():
-            if keyword in description.upper():
+        types = _longest_keywords(description_upper, _COMPONENT_TYPES, _COMPONENT_TYPE_AUTOMATON)
+        for keyword, type_name in _COMPONENT_TYPES.items():
+            if keyword in types:
                 component['type'] = type_name
                 break
         
         # Extract quantity
-        qty_patterns = [
-            r'\((\d+)\s*REQ\.?\)',
-            r'\((\d+)\s*REQUIRED\)',
-            r'(\d+)\s*REQ\.?',
-            r'QTY[:\s]+(\d+)'
-        ]
-        
-        for pattern in qty_patterns:
-            qty_match = re.search(pattern, description, re.IGNORECASE)
+        for pattern in _QUANTITY_PATTERNS:
+            qty_match = pattern.search(description)
             if qty_match:
                 component['quantity'] = qty_match.group(1)
                 break
@@ -360,18 +583,10 @@ class PumpStationParser:
             component['quantity'] = '1'  # Default to 1 if not specified
         
         # Extract manufacturer (if mentioned)
-        manufacturer_patterns = [
-            r'HYDROMATIC',
-            r'MANUFACTURER',
-            r'MFR'
-        ]
-        
-        for pattern in manufacturer_patterns:
-            if re.search(pattern, description, re.IGNORECASE):
-                mfr_match = re.search(r'([A-Z][A-Z\s]+)(?:OR|,|\()', description)
-                if mfr_match:
-                    component['manufacturer'] = mfr_match.group(1).strip()
-                break
+        if _MANUFACTURER_HINT_RE.search(description):
+            mfr_match = _MANUFACTURER_RE.search(description)
+            if mfr_match:
+                component['manufacturer'] = mfr_match.group(1).strip()
         
         return component
     
@@ -396,72 +611,21 @@ class PumpStationParser:
         
         # Combine elevation zone text
         elevation_items = zones.get('elevation_labels', [])
-        if not elevation_items:
+        if elevation_items:
+            full_text = _normalize_field_text(' '.join(map(itemgetter('text'), elevation_items)))
+        else:
             # Fallback: search all text
-            elevation_items = text_items
+            full_text = self._field_text(text_items, zones)
         
-        full_text = ' '.join([item['text'] for item in elevation_items])
         
-        # Patterns for each elevation type
-        patterns = {
-            'top_el': [
-                r'TOP EL\.?[:\s]+([\d.]+)',
-                r'TOP ELEVATION[:\s]+([\d.]+)'
-            ],
-            'high_high_alarm_el': [
-                r'HI[/\s]*HI ALARM EL\.?[:\s]+([\d.]+|__)',
-                r'HIGH[/\s]*HIGH ALARM EL\.?[:\s]+([\d.]+|__)',
-                r'H[/]?H ALARM[:\s]+([\d.]+|__)'
-            ],
-            'high_alarm_el': [
-                r'HIGH ALARM EL\.?[:\s]+([\d.]+|__)',
-                r'HIGH ALARM[:\s]+([\d.]+|__)',
-                r'HI ALARM[:\s]+([\d.]+|__)'
-            ],
-            'override_on_el': [
-                r'OVERRIDE ON EL\.?[:\s]+([\d.]+|__)',
-                r'OVERRIDE ON[:\s]+([\d.]+|__)'
-            ],
-            'lag_on_el': [
-                r'LAG ON EL\.?[:\s]+([\d.]+|__)',
-                r'LAG ON[:\s]+([\d.]+|__)'
-            ],
-            'lead_on_el': [
-                r'LEAD ON EL\.?[:\s]+([\d.]+|__)',
-                r'LEAD ON[:\s]+([\d.]+|__)'
-            ],
-            'override_off_el': [
-                r'OVERRIDE OFF EL\.?[:\s]+([\d.]+|__)',
-                r'OVERRIDE OFF[:\s]+([\d.]+|__)'
-            ],
-            'all_pumps_off_el': [
-                r'ALL PUMPS OFF EL\.?[:\s]+([\d.]+|__)',
-                r'PUMPS OFF EL\.?[:\s]+([\d.]+|__)',
-                r'PUMPS OFF[:\s]+([\d.]+|__)'
-            ],
-            'bottom_el': [
-                r'BOTTOM EL\.?[:\s]+([\d.]+|__)',
-                r'BOTTOM ELEVATION[:\s]+([\d.]+|__)'
-            ],
-            'invert_el': [
-                r'INVERT EL\.?[:\s]+([\d.]+|__)',
-                r'INV EL\.?[:\s]+([\d.]+|__)',
-                r'INVERT ELEVATION[:\s]+([\d.]+|__)'
-            ],
-            'drop_invert_el': [
-                r'DROP INVERT EL\.?[:\s]+([\d.]+|__)',
-                r'DROP INV EL\.?[:\s]+([\d.]+|__)'
-            ],
-            'low_water_level': [
-                r'LWL[:\s]+([\d.]+)',
-                r'LOW WATER LEVEL[:\s]+([\d.]+)'
-            ]
-        }
+        text_upper = full_text.upper()
         
         # Extract each elevation
-        for field, pattern_list in patterns.items():
+        for field, pattern_list in _ELEVATION_PATTERNS.items():
+            if not any(literal in text_upper for literal in _ELEVATION_LITERALS[field]):
+                continue
             for pattern in pattern_list:
-                match = re.search(pattern, full_text, re.IGNORECASE | re.MULTILINE)
+                match = pattern.search(full_text)
                 if match:
                     value = match.group(1).strip()
                     # Keep '__' as placeholder for to-be-determined values
@@ -1,4 +1,6 @@
-from typing import List, Dict
+from operator import itemgetter
+from typing import List, Dict, Optional
+from extractors.BaseExtractor import BaseExtractor
 from extractors.TitleBlockExtractor import TitleBlockExtractor
 from extractors.NotesExtractor import NotesExtractor
 from extractors.SpecificationExtractor import SpecificationExtractor
@@ -6,6 +8,21 @@ from extractors.ReferenceExtractor import ReferenceExtractor
 from extractors.TableExtractor import TableExtractor
 import re
 
+# Numbered notes start with (1), (2), ... (zoning checks for the '(' first)
+_NOTE_ITEM_RE = re.compile(r'\(\d+\)')
+
+# "X minimum", "X ft. minimum" or "X preferred", in one scan. The value is shared;
+# each kind keeps its own unit list
+_REQUIREMENT_RE = re.compile(
+    r'(?P<value>\d+\.?\d*)\s*(?:'
+    r'(?P<min_unit>ft|feet|in|inch|inches)?\s*(?:is\s+the\s+)?(?P<minimum>minimum)'
+    r'|(?P<pref_unit>ft|feet|in|inch)?\s*preferred)',
+    re.IGNORECASE
+)
+
+# Characters of context kept on each side of a requirement
+_CONTEXT_WINDOW = 100
+
 class StandardsDetailParser:
     """Parser for standards/detail drawings like your sanitary sewer doc"""
     
@@ -16,18 +33,26 @@ class StandardsDetailParser:
         self.spec_extractor = SpecificationExtractor()
         self.ref_extractor = ReferenceExtractor()
     
-    def parse(self, text_items: List[Dict]) -> Dict:
-        """Parse standards detail drawing"""
+    def parse(self, text_items: List[Dict], universal_data: Optional[Dict] = None,
+              full_text: Optional[str] = None) -> Dict:
+        """
+        Parse standards detail drawing; universal_data (DrawingParser's universal
+        extractor results) saves re-running the shared extractors, full_text
+        (all item texts joined with spaces) saves joining them again
+        """
         
         zones = self._identify_zones(text_items)
+        if full_text is None:
+            full_text = ' '.join(map(itemgetter('text'), text_items))
+        zones['_full_text'] = full_text
         
         result = {
             'document_type': 'standards_detail',
-            'title_block': self.title_extractor.extract(text_items, zones),
-            'tables': self.table_extractor.extract(text_items, zones),
-            'notes': self.notes_extractor.extract(text_items, zones),
-            'specifications': self.spec_extractor.extract(text_items, zones),
-            'references': self.ref_extractor.extract(text_items, zones),
+            'title_block': self.title_extractor.extract_once(text_items, zones, universal_data),
+            'tables': self.table_extractor.extract_once(text_items, zones, universal_data),
+            'notes': self.notes_extractor.extract_once(text_items, zones, universal_data),
+            'specifications': self.spec_extractor.extract_once(text_items, zones, universal_data),
+            'references': self.ref_extractor.extract_once(text_items, zones, universal_data),
             'requirements': self._extract_requirements(text_items, zones)
         }
         
@@ -44,15 +69,17 @@ class StandardsDetailParser:
         
         for item in text_items:
             bbox = item['bbox']
+            text = item['text']
+            text_lower = text.lower()
             
             # Bottom area is usually title/notes
             if bbox['top'] > 0.85:
                 zones['title'].append(item)
             # Check for table indicators
-            elif 'minimum' in item['text'].lower() or 'ft' in item['text'].lower():
+            elif 'minimum' in text_lower or 'ft' in text_lower:
                 zones['table_area'].append(item)
             # Notes usually have numbered items
-            elif re.match(r'\(\d+\)', item['text']):
+            elif text[:1] == '(' and _NOTE_ITEM_RE.match(text):
                 zones['notes_area'].append(item)
             else:
                 zones['diagram_area'].append(item)
@@ -61,46 +88,31 @@ class StandardsDetailParser:
     
     def _extract_requirements(self, text_items: List[Dict], zones: Dict) -> List[Dict]:
         """Extract specific requirements (separations, minimums, etc.)"""
-        requirements = []
-        
-        full_text = ' '.join([item['text'] for item in text_items])
-        
-        # Pattern: "X minimum" or "X ft. minimum"
-        min_reqs = re.findall(
-            r'(\d+\.?\d*)\s*(ft|feet|in|inch|inches)?\s*(?:is\s+the\s+)?minimum',
-            full_text,
-            re.IGNORECASE
-        )
+        minimums = []
+        preferred = []
         
-        for value, unit in min_reqs:
-            requirements.append({
-                'type': 'minimum',
-                'value': value,
-                'unit': unit if unit else 'unspecified',
-                'context': self._get_context(full_text, f"{value} minimum", 100)
-            })
+        full_text = BaseExtractor._full_text(text_items, zones)
         
-        # Pattern: "X preferred"
-        pref_reqs = re.findall(
-            r'(\d+\.?\d*)\s*(ft|feet|in|inch)?\s*preferred',
-            full_text,
-            re.IGNORECASE
-        )
-        
-        for value, unit in pref_reqs:
-            requirements.append({
-                'type': 'preferred',
-                'value': value,
-                'unit': unit if unit else 'unspecified',
-                'context': self._get_context(full_text, f"{value} preferred", 100)
-            })
+        for match in _REQUIREMENT_RE.finditer(full_text):
+            # Context comes straight from the match offsets
+            start = max(0, match.start() - _CONTEXT_WINDOW)
+            end = min(len(full_text), match.end() + _CONTEXT_WINDOW)
+            context = full_text[start:end].strip()
+            
+            if match.group('minimum'):
+                minimums.append({
+                    'type': 'minimum',
+                    'value': match.group('value'),
+                    'unit': match.group('min_unit') or 'unspecified',
+                    'context': context
+                })
+            else:
+                preferred.append({
+                    'type': 'preferred',
+                    'value': match.group('value'),
+                    'unit': match.group('pref_unit') or 'unspecified',
+                    'context': context
+                })
         
-        return requirements
-    
-    def _get_context(self, text: str, term: str, window: int) -> str:
-        idx = text.find(term)
-        if idx == -1:
-            return ""
-        start = max(0, idx - window)
-        end = min(len(text), idx + len(term) + window)
-        return text[start:end].strip()
\ No newline at end of file
+        # Minimums first, as before
+        return minimums + preferred
@@ -0,0 +1,54 @@
+import asyncio
+from urllib.parse import unquote
+
+import pytest
+from fastapi.testclient import TestClient
+
+import app as app_module
+
+RESULT = {
+    'universal_data': {
+        'specification': [
+            {'type': 'pipe', 'value': '8', 'unit': 'IN', 'context': '8" DIP'},
+            {'type': 'cover', 'value': '36', 'unit': 'IN', 'context': None},
+        ]
+    }
+}
+
+
+@pytest.fixture
+def client():
+    # Not entered as a context manager, so the lifespan (warm-up, worker pool) does not run
+    return TestClient(app_module.app)
+
+
+def _store(document_id: str, filename: str):
+    stored = {'result': RESULT, 'validation': {}, 'filename': filename}
+    asyncio.run(app_module.result_store.set(document_id, stored))
+
+
+@pytest.mark.parametrize('format, extension', [('csv', 'csv'), ('json', 'json'), ('excel', 'xlsx')])
+def test_export_non_ascii_filename(client, format, extension):
+    if format == 'excel':
+        pytest.importorskip('openpyxl')
+    _store('non-ascii', '図面 "A".pdf')
+
+    response = client.get('/export/non-ascii', params={'format': format})
+
+    assert response.status_code == 200
+    disposition = response.headers['content-disposition']
+    assert disposition.startswith('attachment; filename="')
+    assert disposition.isascii()
+    assert f'filename="__ _A_.{extension}"' in disposition
+    encoded = disposition.split("filename*=UTF-8''", 1)[1]
+    assert unquote(encoded) == f'図面 "A".{extension}'
+
+
+
+def test_csv_export_with_null_context(client):
+    _store('null-context', 'plan.pdf')
+
+    response = client.get('/export/null-context', params={'format': 'csv'})
+
+    assert response.status_code == 200
+    assert response.text.splitlines()[-1] == 'Specification,cover,36,IN,'
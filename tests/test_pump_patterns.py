@@ -0,0 +1,82 @@
+import pytest
+
+from parsers.PumpStationParser import (
+    _ELEVATION_LITERALS,
+    _ELEVATION_PATTERNS,
+    _PUMP_DATA_LITERALS,
+    _PUMP_DATA_PATTERNS,
+    _compile_field_pattern,
+    _normalize_field_text,
+)
+
+# (field, source) for every pump data and elevation pattern
+FIELD_PATTERNS = [
+    (field, pattern.pattern[len('(?im)'):] if pattern.pattern.startswith('(?im)') else pattern.pattern)
+    for table in (_PUMP_DATA_PATTERNS, _ELEVATION_PATTERNS)
+    for field, patterns in table.items()
+    for pattern in patterns
+]
+
+# Data box and elevation text as OCR returns it, with no-break, thin and ideographic
+# spaces, \v, full-width and Arabic-Indic digits and non-ASCII letters
+CORPUS = [
+    'PUMP MODEL: S4L-2\nPUMP SERIAL NO. 12345-A',
+    'PUMP MODEL: S4L 2\nSERIAL NO. AB-77',
+    'DESIGN CAPACITY: 250 GPM @ 45 TDH',
+    'PUMP DESIGN POINT: ２５０ GPM @ ４５ TDH',
+    'PUMP H.P.: 7.5\t3 PHASE\u000b230 VOLTS 12.4 AMPS',
+    'PUMP IMP. NO/ 431-B IMP: 6.5" DIA',
+    'SHUT-OFF HEAD: 80 PUMP SPEED: ١٧٥٠ RPM',
+    'STATIC HEAD 22 WET WELL VOLUME:　900 GALLONS 6 FT. DIA',
+    'modèle 5 ß 8V Ø 10" DIA WETWELL',
+    'TOP EL.: 112.50 HI/HI ALARM EL. __ HIGH ALARM EL: 108.2',
+    'LAG ON EL. 104.00\r\nLEAD ON EL 103.5 ALL PUMPS OFF EL.: 100.0',
+    'OVERRIDE ON EL: __ BOTTOM ELEVATION: ٩٥.٠ INV EL 98.1',
+    'DROP INVERT EL. 101.00 LWL: 97.5',
+]
+
+
+def _capture(pattern, text):
+    match = pattern.search(text)
+    return None if match is None else (match.start(), match.end(), match.group(1))
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('SHUT-OFF HEAD: 80', '80'),
+    ('SHUT-OFF HEAD: 80', '80'),      # no-break spaces
+    ('SHUT-OFF HEAD: 80', '80'),           # thin space
+    ('SHUT-OFF HEAD: ８０', '80'),               # full-width digits
+    ('SHUT-OFF HEAD: ٨٠', '80'),      # Arabic-Indic digits
+])
+def test_fallback_matches_normalized_text(text, expected):
+    pattern = _compile_field_pattern(r'SHUT[- ]OFF HEAD[:\s]+(\d+)', use_re2=False)
+    match = pattern.search(_normalize_field_text(text))
+    assert match is not None and match.group(1) == expected
+
+
+def test_normalize_keeps_ascii_whitespace():
+    assert _normalize_field_text('A\tB\nC\r\nD\fE F') == 'A\tB\nC\r\nD\fE F'
+
+
+@pytest.mark.parametrize('text', CORPUS)
+def test_re2_and_fallback_capture_the_same_text(text):
+    pytest.importorskip('re2')
+    text = _normalize_field_text(text)
+    for field, source in FIELD_PATTERNS:
+        with_re2 = _compile_field_pattern(source, use_re2=True)
+        with_re = _compile_field_pattern(source, use_re2=False)
+        assert _capture(with_re2, text) == _capture(with_re, text), (field, source)
+
+
+@pytest.mark.parametrize('text', CORPUS + ['230V 1 PHASE', 'VALVE 4 VAULT'])
+def test_literal_gates_allow_every_match(text):
+    text = _normalize_field_text(text)
+    for patterns, literals in ((_PUMP_DATA_PATTERNS, _PUMP_DATA_LITERALS),
+                               (_ELEVATION_PATTERNS, _ELEVATION_LITERALS)):
+        for field, pattern_list in patterns.items():
+            if any(pattern.search(text) for pattern in pattern_list):
+                assert any(literal in text.upper() for literal in literals[field]), field
+
+
+def test_voltage_gate_skips_text_without_volts():
+    assert not any(literal in 'GATE VALVE 4 VAULT' for literal in _PUMP_DATA_LITERALS['voltage'])